@@ -17,6 +17,7 @@ from .tool import (
     free,
     handle_method,
     loadconfig,
+    postgresql,
     profiler,
     report,
     report_input,
@@ -82,7 +83,11 @@ def main(prog=None, argv=None):
     tagged_profilers = profiler.filtered()
 
     if args.execute:
+        # start shared database in parent -- ahead of any child processes
+        postgresql()
+
         report_input()
+        report.flush()
         print()
 
     trial_num = args.count if args.execute else 1
@@ -115,6 +120,7 @@ def main(prog=None, argv=None):
                 if args.execute and index > 0:
                     print()
                     free()
+                    report.flush()
                     print()
 
                 desc = method.__doc__
@@ -122,10 +128,11 @@ def main(prog=None, argv=None):
                     desc = 'begin: ' + desc if desc else 'begin ...'
 
                 report(method, desc)
+                report.flush()
 
                 if args.execute:
                     if args.subprocess:
-                        shared_results = multiprocessing.Array('f', len(PROFILE_DIMS))
+                        shared_results = multiprocessing.Array('d', len(PROFILE_DIMS))
 
                         proc = multiprocessing.Process(
                             target=handle_method,
@@ -136,7 +143,10 @@ def main(prog=None, argv=None):
 
                         save_child_results(method, shared_results, PROFILE_DIMS)
                     else:
-                        method()
+                        try:
+                            method()
+                        finally:
+                            report.flush()
 
     if args.plot and args.execute:
         for (tag, profilers) in tagged_profilers.items():
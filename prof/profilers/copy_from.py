@@ -1,16 +1,16 @@
+import contextlib
 import io
+import os
+import threading
 
 import pandas
 import sqlalchemy
 
 import prof.tool
 from prof.tool import (
-    dtypes,
     loaddata,
     loadquery,
-    mprof,
-    sizecheck,
-    time,
+    measureframe,
 )
 
 
@@ -20,10 +20,7 @@ profiler = prof.tool.profiler('copy from database to dataframe')
 @profiler
 @loadquery
 @loaddata
-@dtypes
-@mprof
-@time
-@sizecheck
+@measureframe
 def ohio_pg_copy_from_1(engine, query):
     """pg_copy_from(buffer_size=1) {COPY → PipeTextIO → pandas.read_csv}"""
     return pandas.DataFrame.pg_copy_from(query,
@@ -35,10 +32,7 @@ def ohio_pg_copy_from_1(engine, query):
 @profiler
 @loadquery
 @loaddata
-@dtypes
-@mprof
-@time
-@sizecheck
+@measureframe
 def ohio_pg_copy_from_10(engine, query):
     """pg_copy_from(buffer_size=10) {COPY → PipeTextIO → pandas.read_csv}"""
     return pandas.DataFrame.pg_copy_from(query,
@@ -50,10 +44,7 @@ def ohio_pg_copy_from_10(engine, query):
 @profiler
 @loadquery
 @loaddata
-@dtypes
-@mprof
-@time
-@sizecheck
+@measureframe
 def ohio_pg_copy_from_10_stream_results(engine, query):
     """pg_copy_from(buffer_size=10) {stream_results | COPY → PipeTextIO → pandas.read_csv}"""
     engine1 = sqlalchemy.create_engine(engine.url, execution_options=dict(stream_results=True,
@@ -70,10 +61,7 @@ def ohio_pg_copy_from_10_stream_results(engine, query):
 @profiler
 @loadquery
 @loaddata
-@dtypes
-@mprof
-@time
-@sizecheck
+@measureframe
 def ohio_pg_copy_from_100(engine, query):
     """pg_copy_from(buffer_size=100) {COPY → PipeTextIO → pandas.read_csv}"""
     return pandas.DataFrame.pg_copy_from(query,
@@ -85,10 +73,7 @@ def ohio_pg_copy_from_100(engine, query):
 @profiler
 @loadquery
 @loaddata
-@dtypes
-@mprof
-@time
-@sizecheck
+@measureframe
 def ohio_pg_copy_from_1000(engine, query):
     """pg_copy_from(buffer_size=1000) {COPY → PipeTextIO → pandas.read_csv}"""
     return pandas.DataFrame.pg_copy_from(query,
@@ -100,10 +85,31 @@ def ohio_pg_copy_from_1000(engine, query):
 @profiler
 @loadquery
 @loaddata
-@dtypes
-@mprof
-@time
-@sizecheck
+@measureframe
+def ohio_pg_copy_from_10000(engine, query):
+    """pg_copy_from(buffer_size=10_000) {COPY → PipeTextIO → pandas.read_csv}"""
+    return pandas.DataFrame.pg_copy_from(query,
+                                         engine,
+                                         parse_dates=['as_of_date'],
+                                         buffer_size=10_000)
+
+
+@profiler
+@loadquery
+@loaddata
+@measureframe
+def ohio_pg_copy_from_100000(engine, query):
+    """pg_copy_from(buffer_size=100_000) {COPY → PipeTextIO → pandas.read_csv}"""
+    return pandas.DataFrame.pg_copy_from(query,
+                                         engine,
+                                         parse_dates=['as_of_date'],
+                                         buffer_size=100_000)
+
+
+@profiler
+@loadquery
+@loaddata
+@measureframe
 def pandas_read_csv_stringio(engine, query):
     """COPY → StringIO → pandas.read_csv"""
     connection = engine.raw_connection()
@@ -123,10 +129,69 @@ def pandas_read_csv_stringio(engine, query):
 @profiler
 @loadquery
 @loaddata
-@dtypes
-@mprof
-@time
-@sizecheck
+@measureframe
+def pandas_read_csv_bytesio(engine, query):
+    """COPY → BytesIO → pandas.read_csv"""
+    connection = engine.raw_connection()
+    cursor = connection.cursor()
+    buffer = io.BytesIO()
+    cursor.copy_expert(
+        f'COPY ({query}) TO STDOUT WITH CSV HEADER',
+        buffer,
+    )
+    buffer.seek(0)
+    return pandas.read_csv(
+        buffer,
+        parse_dates=['as_of_date'],
+        engine='c',
+        low_memory=False,
+    )
+
+
+@profiler
+@loadquery
+@loaddata
+@measureframe
+def pandas_read_csv_pipe(engine, query):
+    """COPY → os.pipe → pandas.read_csv"""
+    (read_fd, write_fd) = os.pipe()
+    copy_errors = []
+
+    def copy_to_pipe():
+        try:
+            with open(write_fd, 'wb') as outfile, \
+                    contextlib.closing(engine.raw_connection()) as connection:
+                cursor = connection.cursor()
+                cursor.copy_expert(
+                    f'COPY ({query}) TO STDOUT WITH CSV HEADER',
+                    outfile,
+                )
+        except Exception as exc:
+            copy_errors.append(exc)
+
+    writer = threading.Thread(target=copy_to_pipe)
+    writer.start()
+
+    try:
+        # closing the read end (even on error) unblocks the writer
+        with open(read_fd, 'rb') as infile:
+            df = pandas.read_csv(
+                infile,
+                parse_dates=['as_of_date'],
+            )
+    finally:
+        writer.join()
+
+    if copy_errors:
+        raise copy_errors[0]
+
+    return df
+
+
+@profiler
+@loadquery
+@loaddata
+@measureframe
 def pandas_read_sql_chunks_100_stream_results(engine, query):
     """pandas.read_sql(chunksize=100) {stream_results}"""
     engine1 = sqlalchemy.create_engine(engine.url, execution_options=dict(stream_results=True,
@@ -141,10 +206,7 @@ def pandas_read_sql_chunks_100_stream_results(engine, query):
 @profiler
 @loadquery
 @loaddata
-@dtypes
-@mprof
-@time
-@sizecheck
+@measureframe
 def pandas_read_sql_chunks_100(engine, query):
     """pandas.read_sql(chunksize=100)"""
     chunks = pandas.read_sql(query, engine, parse_dates=['as_of_date'], chunksize=100)
@@ -154,10 +216,17 @@ def pandas_read_sql_chunks_100(engine, query):
 @profiler
 @loadquery
 @loaddata
-@dtypes
-@mprof
-@time
-@sizecheck
+@measureframe
+def pandas_read_sql_chunks_10000(engine, query):
+    """pandas.read_sql(chunksize=10_000)"""
+    chunks = pandas.read_sql(query, engine, parse_dates=['as_of_date'], chunksize=10_000)
+    return pandas.concat(chunks, copy=False)
+
+
+@profiler
+@loadquery
+@loaddata
+@measureframe
 def pandas_read_sql(engine, query):
     """pandas.read_sql"""
     return pandas.read_sql(query, engine, parse_dates=['as_of_date'])
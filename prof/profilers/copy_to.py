@@ -1,14 +1,28 @@
+import asyncio
+import collections
+import concurrent.futures
 import contextlib
 import csv
 import functools
 import io
+import multiprocessing
+import os
+import threading
 
+import asyncpg
+import numpy
 import pandas
+import pyarrow
+import pyarrow.csv
 
+import ohio
+from ohio.ext.numpy import PG_COPY_BINARY_HEADER, PG_COPY_BINARY_TRAILER
 import prof.tool
 from prof.tool import (
+    column_type,
     countcheck,
     create_table,
+    header_columns,
     loadconfig,
     loaddb,
     loadframe,
@@ -29,6 +43,8 @@ profiler = prof.tool.profiler('copy from dataframe to database')
 @time
 def pandas_to_sql(config, df, engine):
     """pandas.DataFrame.to_sql"""
+    # (result not returned: under executemany, psycopg2 reports only the
+    # last batch's rowcount)
     df.to_sql(config.table_name, engine)
 
 
@@ -41,7 +57,7 @@ def pandas_to_sql(config, df, engine):
 @time
 def pandas_to_sql_multi_100(config, df, engine):
     """pandas.DataFrame.to_sql(chunksize=100, method='multi')"""
-    df.to_sql(config.table_name, engine, chunksize=100, method='multi')
+    return df.to_sql(config.table_name, engine, chunksize=100, method='multi')
 
 
 @profiler
@@ -53,7 +69,7 @@ def pandas_to_sql_multi_100(config, df, engine):
 @time
 def pandas_to_sql_multi_1000(config, df, engine):
     """pandas.DataFrame.to_sql(chunksize=1_000, method='multi')"""
-    df.to_sql(config.table_name, engine, chunksize=1_000, method='multi')
+    return df.to_sql(config.table_name, engine, chunksize=1_000, method='multi')
 
 
 @profiler
@@ -82,6 +98,211 @@ def generic_copy_stringio_to_db(config, df, engine):
         )
         conn.commit()
 
+    return cursor.rowcount
+
+
+def csv_size_estimate(df, sample_size=1000, slack=1.1):
+    """Estimate the size (in bytes) of ``df`` encoded as CSV, from
+    the encoding of its leading ``sample_size`` rows.
+
+    (In-memory size is a poor proxy: a float64 takes 8 bytes in
+    memory but up to ~20 as text.)
+
+    """
+    if df.empty:
+        return 0
+
+    sample = df.head(sample_size).to_csv().encode()
+    return int(len(sample) / min(sample_size, len(df)) * len(df) * slack)
+
+
+@profiler
+@loaddb
+@loadframe
+@loadconfig
+@countcheck
+@mprof
+@time
+def generic_copy_bytesio_to_db(config, df, engine):
+    """DataFrame → BytesIO (preallocated) → COPY"""
+    with config.data_path.open() as fd:
+        header = next(fd)
+
+    create_table(header, engine)
+
+    # BytesIO is copy-on-write over its initial bytes: the first write
+    # allocates a private buffer of the full estimated size, which
+    # to_csv then overwrites in place (growing only if the estimate was
+    # short). Truncating at the end of the CSV -- rather than up front,
+    # which would release the allocation -- drops the unused tail.
+    buffer = io.BytesIO(bytes(csv_size_estimate(df)))
+    df.to_csv(buffer, mode='wb')
+    buffer.truncate()
+    buffer.seek(0)
+
+    with contextlib.closing(engine.raw_connection()) as conn:
+        cursor = conn.cursor()
+        cursor.copy_expert(
+            f'copy {config.table_name} from stdin with csv header',
+            buffer,
+        )
+        conn.commit()
+
+    return cursor.rowcount
+
+
+def copy_pipe_to_db(table_name, engine, write_csv, binary=False):
+    """Stream CSV written by ``write_csv`` -- in a writer thread, to an
+    ``os.pipe`` -- into ``COPY``.
+
+    Returns the number of rows copied.
+
+    """
+    mode = 'b' if binary else ''
+    (read_fd, write_fd) = os.pipe()
+    write_errors = []
+
+    def write_pipe():
+        try:
+            with open(write_fd, 'w' + mode) as outfile:
+                write_csv(outfile)
+        except Exception as exc:
+            write_errors.append(exc)
+
+    writer = threading.Thread(target=write_pipe)
+    writer.start()
+
+    try:
+        # closing the read end (even on error) unblocks the writer
+        with open(read_fd, 'r' + mode) as infile, \
+                contextlib.closing(engine.raw_connection()) as conn:
+            cursor = conn.cursor()
+            cursor.copy_expert(
+                f'copy {table_name} from stdin with csv header',
+                infile,
+            )
+
+            # COPY has read to the end of the pipe -- but that may be
+            # merely where the writer failed: don't commit a partial copy
+            writer.join()
+            if write_errors:
+                raise write_errors[0]
+
+            conn.commit()
+    finally:
+        writer.join()
+
+    return cursor.rowcount
+
+
+@profiler
+@loaddb
+@loadframe
+@loadconfig
+@countcheck
+@mprof
+@time
+def generic_copy_pipe_to_db(config, df, engine):
+    """DataFrame → os.pipe → COPY"""
+    with config.data_path.open() as fd:
+        header = next(fd)
+
+    create_table(header, engine)
+
+    return copy_pipe_to_db(config.table_name, engine, df.to_csv)
+
+
+@profiler
+@loaddb
+@loadframe
+@loadconfig
+@countcheck
+@mprof
+@time
+def arrow_copy_pipe_to_db(config, df, engine):
+    """DataFrame → pyarrow.csv → os.pipe → COPY"""
+    with config.data_path.open() as fd:
+        header = next(fd)
+
+    create_table(header, engine)
+
+    # index columns are placed last by pyarrow; instead, ensure first
+    table = pyarrow.Table.from_pandas(df.reset_index(), preserve_index=False)
+
+    return copy_pipe_to_db(
+        config.table_name,
+        engine,
+        functools.partial(pyarrow.csv.write_csv, table),
+        binary=True,
+    )
+
+
+# DataFrame shared with forked partition workers (copy-on-write)
+_partition_frame = None
+
+
+def _partition_to_csv(start, stop):
+    return _partition_frame.iloc[start:stop].to_csv(header=False)
+
+
+def iter_csv_partitions(df, workers, partitions_per_worker=4):
+    """Generate the CSV encoding of ``df`` -- header first, and then
+    row-wise partitions encoded in parallel by forked worker processes,
+    (in order, and with at most ``workers`` partitions in flight).
+
+    """
+    global _partition_frame
+
+    bounds = numpy.linspace(0, len(df), workers * partitions_per_worker + 1, dtype=int)
+    pending = collections.deque()
+
+    yield df.head(0).to_csv()
+
+    _partition_frame = df
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            workers,
+            mp_context=multiprocessing.get_context('fork'),
+        ) as executor:
+            for (start, stop) in zip(bounds[:-1], bounds[1:]):
+                if len(pending) == workers:
+                    yield pending.popleft().result()
+
+                pending.append(executor.submit(_partition_to_csv, start, stop))
+
+            while pending:
+                yield pending.popleft().result()
+    finally:
+        _partition_frame = None
+
+
+@profiler
+@loaddb
+@loadframe
+@loadconfig
+@countcheck
+@mprof
+@time
+def parallel_copy_to_db(config, df, engine):
+    """DataFrame → ProcessPoolExecutor(to_csv) → IteratorTextIO → COPY"""
+    with config.data_path.open() as fd:
+        header = next(fd)
+
+    create_table(header, engine)
+
+    csv_partitions = iter_csv_partitions(df, os.cpu_count())
+
+    with ohio.IteratorTextIO(csv_partitions) as infile, \
+            contextlib.closing(engine.raw_connection()) as conn:
+        cursor = conn.cursor()
+        cursor.copy_expert(
+            f'copy {config.table_name} from stdin with csv header',
+            infile,
+        )
+        conn.commit()
+
+    return cursor.rowcount
+
 
 @pandas.api.extensions.register_dataframe_accessor('stringio_copy_to')
 class DataFrameStringIOCopyTo:
@@ -91,7 +312,7 @@ class DataFrameStringIOCopyTo:
 
     @functools.wraps(pandas.DataFrame.to_sql)
     def __call__(self, *args, **kwargs):
-        self.data_frame.to_sql(
+        return self.data_frame.to_sql(
             *args,
             method=self.copy_to,
             **kwargs,
@@ -117,6 +338,7 @@ class DataFrameStringIOCopyTo:
 
         with conn.connection.cursor() as cursor:
             cursor.copy_expert(sql, buffer)
+            return cursor.rowcount
 
 
 @profiler
@@ -128,7 +350,7 @@ class DataFrameStringIOCopyTo:
 @time
 def copy_stringio_to_db(config, df, engine):
     """stringio_copy_to {DataFrame → StringIO → COPY}"""
-    df.stringio_copy_to(config.table_name, engine)
+    return df.stringio_copy_to(config.table_name, engine)
 
 
 @profiler
@@ -141,3 +363,130 @@ def copy_stringio_to_db(config, df, engine):
 def ohio_pg_copy_to(config, df, engine):
     """pg_copy_to {DataFrame → CsvTextIO → COPY}"""
     df.pg_copy_to(config.table_name, engine)
+
+
+@profiler
+@loaddb
+@loadframe
+@loadconfig
+@countcheck
+@mprof
+@time
+def ohio_pg_copy_to_arrow(config, df, engine):
+    """pg_copy_to(arrow=True) {DataFrame → pyarrow.csv → COPY}"""
+    df.pg_copy_to(config.table_name, engine, arrow=True)
+
+
+async def copy_records_to_db(dsn, table_name, columns, records):
+    """Copy the given iterable of records into the named table via
+    asyncpg, which encodes them in the binary ``COPY`` format.
+
+    Returns the number of rows copied.
+
+    """
+    conn = await asyncpg.connect(dsn)
+    try:
+        status = await conn.copy_records_to_table(table_name,
+                                                  records=records,
+                                                  columns=columns)
+    finally:
+        await conn.close()
+
+    # status of the form: COPY <count>
+    return int(status.split()[-1])
+
+
+@profiler
+@loaddb
+@loadframe
+@loadconfig
+@countcheck
+@mprof
+@time
+def asyncpg_copy_records(config, df, engine):
+    """DataFrame → tuples → asyncpg → COPY BINARY"""
+    with config.data_path.open() as fd:
+        header = next(fd)
+
+    create_table(header, engine)
+
+    columns = header_columns(header)
+
+    # asyncpg encodes timestamps from datetimes (not dates)
+    timestamps = {
+        column: pandas.to_datetime(df[column])
+        for column in df.columns
+        if column_type(column) == 'timestamp'
+    }
+    records = df.assign(**timestamps).itertuples(index=True, name=None)
+
+    return asyncio.run(
+        copy_records_to_db(str(engine.url), config.table_name, columns, records)
+    )
+
+
+PG_EPOCH = numpy.datetime64('2000-01-01', 'us')
+
+
+def encode_pg_binary(df, col_types):
+    """Encode the given DataFrame, (including its index), in the
+    PostgreSQL binary ``COPY`` format.
+
+    Values are encoded column-wise as big-endian NumPy arrays, and
+    interleaved with their per-field framing via a structured dtype.
+    Only ``timestamp`` and ``double precision`` columns are supported,
+    (and these may not contain null timestamps).
+
+    """
+    frame = df.reset_index()
+
+    fields = [('field_count', '>i2')]
+    values = []
+    for (index, (column, col_type)) in enumerate(zip(frame.columns, col_types)):
+        if col_type == 'timestamp':
+            timestamps = pandas.to_datetime(frame[column]).values.astype('datetime64[us]')
+            fields.append((f'len{index}', '>i4'))
+            fields.append((f'val{index}', '>i8'))
+            values.append((timestamps - PG_EPOCH).astype('int64'))
+        elif col_type == 'double precision':
+            fields.append((f'len{index}', '>i4'))
+            fields.append((f'val{index}', '>f8'))
+            values.append(frame[column].values.astype('float64'))
+        else:
+            raise TypeError(f"unsupported column type: {col_type}")
+
+    rows = numpy.empty(len(frame), dtype=fields)
+    rows['field_count'] = len(values)
+    for (index, value) in enumerate(values):
+        rows[f'len{index}'] = 8
+        rows[f'val{index}'] = value
+
+    return PG_COPY_BINARY_HEADER + rows.tobytes() + PG_COPY_BINARY_TRAILER
+
+
+@profiler
+@loaddb
+@loadframe
+@loadconfig
+@countcheck
+@mprof
+@time
+def copy_binary_to_db(config, df, engine):
+    """DataFrame → numpy (PGCOPY) → BytesIO → COPY BINARY"""
+    with config.data_path.open() as fd:
+        header = next(fd)
+
+    create_table(header, engine)
+
+    columns = header_columns(header)
+    buffer = io.BytesIO(encode_pg_binary(df, [column_type(column) for column in columns]))
+
+    with contextlib.closing(engine.raw_connection()) as conn:
+        cursor = conn.cursor()
+        cursor.copy_expert(
+            f'copy {config.table_name} from stdin with binary',
+            buffer,
+        )
+        conn.commit()
+
+    return cursor.rowcount
@@ -1,19 +1,23 @@
+import atexit
 import collections
-import contextlib
-import csv
 import functools
 import gc
+import inspect
 import math
-import re
+import multiprocessing
+import os
 import shutil
-import timeit
+import sys
+from time import perf_counter_ns
 
+import numpy
 import pandas
+import psutil
+import pyarrow.parquet
 import sqlalchemy
 import testing.postgresql
-from memory_profiler import memory_usage
 
-from .util import contextmanager, SharingContextDecorator, wrapper
+from .util import contextmanager, SharingContextDecorator, Wrapper
 
 
 class ConfigWrapper(SharingContextDecorator):
@@ -148,11 +152,13 @@ class ProfilerRegistry(collections.defaultdict):
             key=lambda pair: self._sort_key(pair[0]),
         )
 
-        return {
-            key: list(filter(self._include_profiler, profilers))
-            for (key, profilers) in ordered
-            if self._include_tag(key)
-        }
+        with loadconfig as config:
+            return {
+                key: [profiler for profiler in profilers
+                      if self._include_profiler(config, profiler)]
+                for (key, profilers) in ordered
+                if self._include_tag(config, key)
+            }
 
     @staticmethod
     def _sort_key(key, last=('z' * 10_000)):
@@ -164,13 +170,11 @@ class ProfilerRegistry(collections.defaultdict):
         return last if key is None else key
 
     @staticmethod
-    @loadconfig
     def _include_profiler(config, profiler):
         return not config.filters or all(filter_.search(profiler.__name__)
                                          for filter_ in config.filters)
 
     @staticmethod
-    @loadconfig
     def _include_tag(config, tag):
         return not config.tag_filters or all(filter_.search(tag or '')
                                              for filter_ in config.tag_filters)
@@ -180,21 +184,50 @@ profiler = ProfilerRegistry()
 
 
 class Reporter:
-    """Report information associated with the current profiler."""
+    """Report information associated with the current profiler.
+
+    Reports are buffered, and written to standard output -- at once --
+    only upon ``flush``, (such that console I/O does not weigh on
+    profiler invocations). Buffered reports are also flushed at exit.
 
+    """
     def __init__(self):
         self.last_func = None
+        self._lines = []
 
-    def __call__(self, *args, **kwargs):
+    def __call__(self, *args, sep=' ', end='\n'):
         if callable(args[0]):
             (func, *args) = args
             self.last_func = func.__name__
 
-        print(f'[{self.last_func}]', *args, **kwargs)
+        self._lines.append(sep.join(map(str, (f'[{self.last_func}]', *args))) + end)
+
+    def flush(self):
+        if self._lines:
+            sys.stdout.write(''.join(self._lines))
+            self._lines.clear()
+
+        sys.stdout.flush()
 
 
 report = Reporter()
 
+atexit.register(report.flush)
+
+
+def header_columns(header):
+    """Parse the column names from the given input data header line.
+
+    Column names are expected to be SQL-safe identifiers, (and so
+    contain neither commas nor quotes); as such, the header is simply
+    split, rather than parsed by ``csv``.
+
+    """
+    return header.rstrip('\r\n').split(',')
+
+
+READ_CHUNK_SIZE = 1024 * 1024
+
 
 @loadconfig
 def report_input(config):
@@ -202,10 +235,24 @@ def report_input(config):
     with config.data_path.open() as fd:
         header = next(fd)
 
-        (columns,) = csv.reader((header,))
-        col_count = len(columns)
+    columns = header_columns(header)
+    col_count = len(columns)
+
+    if frame_cache_current(config):
+        # row count is recorded in the Parquet footer
+        row_count = pyarrow.parquet.read_metadata(frame_cache_path(config)).num_rows
+    else:
+        # count lines in (C-level) scans of binary chunks
+        line_count = 0
+        chunk = b''
+        with config.data_path.open('rb') as fd:
+            for chunk in iter(functools.partial(fd.read, READ_CHUNK_SIZE), b''):
+                line_count += chunk.count(b'\n')
+
+        if not chunk.endswith(b'\n'):
+            line_count += 1  # final line unterminated
 
-        row_count = sum(1 for _row in fd)
+        row_count = line_count - 1  # less header
 
     report(report_input, 'size data (rows x columns):',
            row_count, 'x', col_count, f'({row_count * col_count})')
@@ -219,6 +266,8 @@ def banner(message, fill, padding=' '):
     filling the width of the terminal.
 
     """
+    report.flush()
+
     message = f'{padding}{message}{padding}'
     term_size = shutil.get_terminal_size()
     columns = term_size.columns
@@ -234,199 +283,452 @@ def report_tag(tag):
     banner(tag, '-')
 
 
+def rss(pid=None):
+    """Retrieve the current resident set size of the current process --
+    or of the process with the given ``pid`` -- in megabytes.
+
+    """
+    return psutil.Process(pid).memory_info().rss / 1024 / 1024
+
+
 def free():
     """Force a garbage collector run and report on the process's current
     memory use.
 
     """
-    mem_stats = memory_usage((gc.collect,))
-    mem0 = math.ceil(mem_stats[0])
-    mem1 = math.ceil(mem_stats[-1])
+    mem0 = math.ceil(rss())
+    gc.collect()
+    mem1 = math.ceil(rss())
     freed = mem0 - mem1
     report(free, 'memory (mb):', mem0, '→', mem1, f'({freed} freed)')
 
 
-# @contextmanager
-# def time():
-#     try:
-#         start = timeit.default_timer()
-#         yield
-#     finally:
-#         report('time (s):', round(timeit.default_timer() - start, 2))
+def record_time(func, duration):
+    """Report and record the given execution time (in seconds) of the
+    given profiler.
 
-@wrapper
-@results
-def time(results, func, *args, **kwargs):
+    """
+    report('time (s):', f'{duration:.4f}')
+    results.save(func, time=duration)
+
+
+class time(Wrapper):
     """Report and record the execution time in seconds for the decorated
     function upon each invocation.
 
     """
-    start = timeit.default_timer()
-    result = func(*args, **kwargs)
-    duration = round(timeit.default_timer() - start, 2)
+    def __call__(self, *args, **kwargs):
+        start = perf_counter_ns()
+        result = self.__wrapped__(*args, **kwargs)
+        duration = (perf_counter_ns() - start) / 1e9
 
-    report('time (s):', duration)
-    results.save(func, time=duration)
+        record_time(self, duration)
 
-    return result
+        return result
 
 
-@wrapper
-def dtypes(func, *args, **kwargs):
-    """Report the Pandas dtypes of the DataFrame returned by the
-    decorated function.
+def report_dtypes(df):
+    """Report the Pandas dtypes of the given DataFrame."""
+    dtypes = df.dtypes.value_counts()
+    report('dtypes result:', {str(dtype): count for (dtype, count) in dtypes.items()})
+
+
+def _sample_rss_peak(pid, interval, conn):
+    """Sample the resident set size of the process with the given
+    ``pid`` every ``interval`` seconds, until signaled via ``conn``.
+
+    The initial sample is sent upon start, and the peak upon signal.
 
     """
-    result = func(*args, **kwargs)
+    peak = rss(pid)
+    conn.send(peak)
 
-    dtypes = collections.Counter(map(str, result.dtypes.values))
-    report('dtypes result:', dict(dtypes))
+    while not conn.poll(interval):
+        peak = max(peak, rss(pid))
 
-    return result
+    conn.recv()
+    conn.send(peak)
 
 
-@wrapper
-@results
-def mprof(results, func, *args, **kwargs):
-    """Report and record the memory usage of each invocation of the
-    decorated function.
+class rss_peak:
+    """Context manager which samples the resident set size of the
+    current process, in megabytes, throughout the context, (from a
+    child process, so as not to compete with the measured code for the
+    interpreter).
 
-    If the function returns a Pandas DataFrame, this object's memory
-    usage is reported, and subtracted from the recorded memory usage
-    (overhead) of the executed function.
+    The size upon entry is recorded as ``start``, and the greatest size
+    sampled -- including upon exit -- as ``peak``.
+
+    (Unlike the process's ``ru_maxrss``, which is its high-water mark
+    over its entire life, this peak is of the context alone; however,
+    peaks shorter-lived than the sampling ``interval`` may be missed.)
+
+    """
+    interval = 0.01
+
+    def __init__(self, interval=None):
+        self.interval = interval or self.interval
+        self.start = self.peak = None
+        self._conn = None
+        self._sampler = None
+
+    def __enter__(self):
+        (self._conn, sampler_conn) = multiprocessing.Pipe()
+        self._sampler = multiprocessing.Process(
+            target=_sample_rss_peak,
+            args=(os.getpid(), self.interval, sampler_conn),
+            daemon=True,
+        )
+        self._sampler.start()
+
+        # (wait on sampler's first sample: sampling has begun)
+        self.start = self.peak = self._conn.recv()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._conn.send(None)
+        peak = self._conn.recv()
+        self._sampler.join()
+        self._conn.close()
+
+        self.peak = max(self.peak, peak, rss())
+
+
+@contextmanager
+def gc_paused():
+    """Context manager which disables automatic (generational) garbage
+    collection for the duration of the context.
+
+    Collection is re-enabled upon exit only if it had been enabled upon
+    entry.
 
     """
-    result = None
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
 
-    def inner():
-        nonlocal result
-        result = func(*args, **kwargs)
 
-    mem_stats = memory_usage((inner,))
+def record_memory(func, mem0, mem1, result):
+    """Report and record the memory usage of the given profiler, from
+    the process's resident set size (in megabytes) before (``mem0``)
+    and at its peak during (``mem1``) its invocation, and its
+    ``result``.
 
-    mem0 = math.ceil(mem_stats[0])
-    mem1 = math.ceil(max(mem_stats))
+    """
     mem_added = mem1 - mem0
     report('memory used (mb):', mem0, '→', mem1, f'({mem_added} added)')
 
     if isinstance(result, pandas.DataFrame):
-        mem_result = result.memory_usage(index=True, deep=True).sum() / 1024 / 1024
-        report('memory result (mb):', math.ceil(mem_result))
+        bytes_result = int(result.memory_usage(index=True, deep=True).sum())
+        report('memory result (mb):', -(-bytes_result >> 20))  # (ceiling)
     else:
-        mem_result = 0
+        bytes_result = 0
 
-    mem_overhead = math.ceil(mem1 - mem_result)
+    # (as mem1 is integral, floor of subtrahend is ceiling of difference)
+    mem_overhead = mem1 - (bytes_result >> 20)
     report('memory overhead (mb):', mem_overhead)
 
     results.save(func, memory=mem_overhead)
 
-    return result
 
+class mprof(Wrapper):
+    """Report and record the memory usage of each invocation of the
+    decorated function.
+
+    Memory usage is measured as the growth in the process's resident
+    set size to its peak, as sampled throughout invocation (by
+    ``rss_peak``). Garbage is collected prior to invocation, and
+    automatic collection is paused throughout.
 
-def sizecheck(func):
-    """Report the size of the DataFrame returned by the decorated
-    function.
+    If the function returns a Pandas DataFrame, this object's memory
+    usage is reported, and subtracted from the recorded memory usage
+    (overhead) of the executed function.
 
     """
-    @functools.wraps(func)
-    def wrapped(*args, **kwargs):
-        df = func(*args, **kwargs)
+    def __call__(self, *args, **kwargs):
+        gc.collect()
+
+        with gc_paused(), rss_peak() as mem:
+            result = self.__wrapped__(*args, **kwargs)
+
+        record_memory(self, math.ceil(mem.start), math.ceil(mem.peak), result)
+
+        return result
+
+
+class measureframe(Wrapper):
+    """Report and record the execution time and memory usage of each
+    invocation of the decorated function, as well as the size and dtypes
+    of the DataFrame it returns.
+
+    Equivalent to the decoration ``@mprof @time`` -- together with
+    reports of the DataFrame's size and dtypes -- but entering a single
+    wrapper (frame) per invocation.
+
+    """
+    def __call__(self, *args, **kwargs):
+        gc.collect()
+
+        with gc_paused(), rss_peak() as mem:
+            start = perf_counter_ns()
+            df = self.__wrapped__(*args, **kwargs)
+            duration = (perf_counter_ns() - start) / 1e9
+
         report('size result (cells):', df.size)
-        return df
+        record_time(self, duration)
+        record_memory(self, math.ceil(mem.start), math.ceil(mem.peak), df)
+        report_dtypes(df)
 
-    return wrapped
+        return df
 
 
-@wrapper
-@loadconfig
-def countcheck(config, func, *args, **kwargs):
+class countcheck(Wrapper):
     """Report the row count of the profiling database table following
     invocation of the decorated function.
 
+    The table is always queried -- via the database connection engine
+    taken from the decorated function's (positional) argument named
+    ``engine``.
+
+    Functions may moreover return the number of rows they wrote, as
+    reported by the database -- (*e.g.* the cursor ``rowcount``
+    following ``COPY``) -- which is reported where it disagrees with
+    the table's count.
+
+    """
+    def __init__(self, func):
+        super().__init__(func)
+
+        parameters = tuple(inspect.signature(func).parameters)
+        if 'engine' not in parameters:
+            raise TypeError(f"{func.__name__} accepts no argument 'engine'")
+
+        self.engine_index = parameters.index('engine')
+
+    def __call__(self, *args, **kwargs):
+        result = self.__wrapped__(*args, **kwargs)
+
+        engine = args[self.engine_index]
+        with loadconfig as config:
+            count = engine.execute(f'select count(1) from {config.table_name}').scalar()
+
+        report('count table (rows):', count)
+
+        if isinstance(result, int) and result != count:
+            report('count mismatch (rows):', result, 'reported')
+
+        return result
+
+
+# durability is of no concern to a throwaway cluster
+# (and fsync is already disabled by testing.postgresql's -F)
+POSTGRES_ARGS = ' '.join((
+    testing.postgresql.Postgresql.DEFAULT_SETTINGS['postgres_args'],
+    '-c synchronous_commit=off',
+    '-c full_page_writes=off',
+))
+
+_postgresql = None
+
+
+def postgresql():
+    """Retrieve the temporary PostgreSQL database cluster shared by all
+    profilers.
+
+    The cluster is started upon first retrieval, and stopped at exit.
+    Child processes forked thereafter share the cluster, (but may not
+    stop it).
+
     """
-    result = func(*args, **kwargs)
+    global _postgresql
+
+    if _postgresql is None:
+        _postgresql = testing.postgresql.Postgresql(postgres_args=POSTGRES_ARGS)
+        atexit.register(_postgresql.stop)
 
-    (engine,) = (arg for arg in args if isinstance(arg, sqlalchemy.engine.Engine))  # FIXME?
-    count = engine.execute(f'select count(1) from {config.table_name}').scalar()
-    report('count table (rows):', count)
+    return _postgresql
 
-    return result
+
+def postgresql_url():
+    """Construct the SQLAlchemy URL of the shared temporary database
+    (see ``postgresql``).
+
+    Connections are made via the cluster's Unix-domain socket, rather
+    than TCP loopback, (which remains enabled for the benefit of
+    ``testing.postgresql``).
+
+    """
+    cluster = postgresql()
+    dsn = cluster.dsn()
+    return sqlalchemy.engine.URL.create(
+        'postgresql',
+        username=dsn['user'],
+        database=dsn['database'],
+        query={
+            'host': os.path.join(cluster.base_dir, 'tmp'),
+            'port': str(dsn['port']),
+        },
+    )
 
 
 @contextmanager
 def loaddb():
-    """Context manager and decorator which creates a temporary
-    PostgreSQL database and provides the context or function an
-    associated SQLAlchemy database connection engine.
+    """Context manager and decorator which provides the context or
+    function an SQLAlchemy database connection engine to a temporary
+    PostgreSQL database.
+
+    The database cluster is shared (see ``postgresql``); rather than
+    recreate it, the configured table is dropped upon each invocation.
 
     """
-    with testing.postgresql.Postgresql() as postgresql:
-        engine = sqlalchemy.create_engine(postgresql.url())
-        try:
-            yield engine
-        finally:
-            engine.dispose()
+    engine = sqlalchemy.create_engine(postgresql_url(), pool_size=1)
+    try:
+        with loadconfig as config:
+            engine.execute(f'drop table if exists {config.table_name}')
+
+        yield engine
+    finally:
+        engine.dispose()
+
 
+@functools.lru_cache(maxsize=512)
+def column_type(column):
+    """Infer the database type of the named input data column.
 
-COL_TYPE_PATTERNS = (
-    ('timestamp', re.compile(r'(^|[-_ ])date([-_ ]|$)')),
-    ('double precision', re.compile('')),  # match all
-)
+    Columns named with the word "date" -- (*e.g.* ``as_of_date``) -- are
+    timestamps; all others are numeric.
+
+    """
+    words = column.replace('-', ' ').replace('_', ' ').split(' ')
+    return 'timestamp' if 'date' in words else 'double precision'
 
 
-def column_type(column, default='varchar'):
-    for (col_type, col_pattern) in COL_TYPE_PATTERNS:
-        if col_pattern.search(column):
-            return col_type
+@functools.lru_cache()
+def column_definitions(columns):
+    """Construct the SQL column definitions for the given ``tuple`` of
+    input data column names.
 
-    return default
+    """
+    return ', '.join(f'{column} ' + column_type(column) for column in columns)
 
 
 @loadconfig
-def create_table(config, header, engine):
+def create_table(config, header, engine, table_name=None):
     """Create an empty database table according to configuration and the
     input data header.
 
+    The table may be named explicitly by ``table_name``.
+
     """
-    (columns,) = csv.reader((header,))
-    col_defn = ', '.join(f'{column} ' + column_type(column)
-                         for column in columns)
+    columns = header_columns(header)
+    col_defn = column_definitions(tuple(columns))
 
-    engine.execute(f'create table {config.table_name} ({col_defn})')
+    engine.execute(f'create table {table_name or config.table_name} ({col_defn})')
+
+
+def input_table(config):
+    """Construct the name of the database table populated by
+    ``loaddata`` according to configuration.
+
+    """
+    return f'{config.table_name}_input'
 
 
 @loaddb.manager
 @loadconfig.manager
 def loaddata(config, engine):
-    """Context manager and decorator which creates the configured
-    database table and populates it with input data.
+    """Context manager and decorator which provides a database
+    populated with input data.
+
+    Input data are loaded into a dedicated table (see ``input_table``)
+    -- in a single transaction -- only if this does not already exist.
+    As the database cluster is shared, data are loaded once per
+    profiling run, (rather than once per profiler).
 
     An associated SQLAlchemy database connection engine is provided to
     the context or function.
 
     """
-    with config.data_path.open() as fd:
-        header = next(fd)
-        create_table(header, engine)
+    table_name = input_table(config)
+
+    if not sqlalchemy.inspect(engine).has_table(table_name):
+        with config.data_path.open('rb') as fd, engine.begin() as conn:
+            header = fd.readline().decode()
+            create_table(header, conn, table_name=table_name)
 
-        with contextlib.closing(engine.raw_connection()) as conn:
-            cursor = conn.cursor()
+            # stream raw bytes -- header and all -- to COPY
+            fd.seek(0)
+
+            cursor = conn.connection.cursor()
             cursor.copy_expert(
-                f'copy {config.table_name} from stdin with csv',
+                f'copy {table_name} from stdin with csv header',
                 fd,
             )
-            conn.commit()
 
     yield engine
 
 
+def frame_cache_path(config):
+    """Construct the path of the Parquet cache of input data (see
+    ``loadframe``).
+
+    """
+    return config.data_path.with_suffix('.parquet')
+
+
+def frame_cache_current(config):
+    """Return whether the Parquet cache of input data exists and is
+    newer than the input.
+
+    """
+    cache_path = frame_cache_path(config)
+    return (
+        cache_path.exists() and
+        cache_path.stat().st_mtime >= config.data_path.stat().st_mtime
+    )
+
+
 @loadconfig.manager
-def loadframe(config):
+def loadframe(config, columns=None):
     """Context manager and decorator providing a Pandas DataFrame
     populated by the input data.
 
+    Input is parsed by the (multi-threaded) pyarrow engine, and cached
+    in Parquet format alongside the input file. The cache is reused so
+    long as it is newer than the input, and may be read for only a
+    subset of ``columns``.
+
+    The DataFrame is laid out such that each column is contiguous in
+    memory.
+
     """
-    yield pandas.read_csv(config.data_path, index_col='entity_id', parse_dates=True)
+    cache_path = frame_cache_path(config)
+
+    if not frame_cache_current(config):
+        df = pandas.read_csv(config.data_path,
+                             index_col='entity_id',
+                             parse_dates=True,
+                             engine='pyarrow')
+
+        # write to temporary path s.t. no partial cache may be read
+        temp_path = cache_path.with_suffix('.parquet.tmp')
+        df.to_parquet(temp_path, compression='zstd')
+        temp_path.replace(cache_path)
+
+    df = pandas.read_parquet(cache_path, columns=columns)
+
+    if len(set(df.dtypes)) == 1 and df.dtypes.iloc[0].kind in 'biuf':
+        # homogeneous & numeric: rebuild from column-major array
+        yield pandas.DataFrame(numpy.asfortranarray(df.values),
+                               index=df.index,
+                               columns=df.columns)
+    else:
+        # consolidate blocks (within which columns are contiguous)
+        yield df.copy()
 
 
 @loadconfig.manager
@@ -435,7 +737,7 @@ def loadquery(config):
     to retrieve all data from the database.
 
     """
-    yield f'select * from {config.table_name}'
+    yield f'select * from {input_table(config)}'
 
 
 @results
@@ -444,7 +746,10 @@ def handle_method(results, method, shared_results, result_keys):
     method_results = results.get(method)
     current_lengths = [(key, len(method_results[key])) for key in result_keys]
 
-    method()
+    try:
+        method()
+    finally:
+        report.flush()
 
     for (index, (key, length0)) in enumerate(current_lengths):
         key_results = method_results[key]
@@ -461,6 +766,5 @@ def save_child_results(results, method, shared_results, result_keys):
     in a child process, (having been returned by ``handle_method``).
 
     """
-    rounded_values = (round(result, 2) for result in shared_results)
-    method_results = dict(zip(result_keys, rounded_values))
+    method_results = dict(zip(result_keys, shared_results))
     results.save(method, **method_results)
@@ -1,61 +1,29 @@
-import abc
 import contextlib
 import functools
 
 
-class Wrapper(abc.ABC):
+class Wrapper:
     """Functional wrapping via class definition and instantiation.
 
     Provides ``repr`` which indicates the wrapping chain.
 
     """
     def __init__(self, func):
-        functools.update_wrapper(self, func)
+        # in lieu of functools.update_wrapper -- assign only what's used
+        self.__module__ = getattr(func, '__module__', None)
+        self.__name__ = getattr(func, '__name__', repr(func))
+        self.__qualname__ = getattr(func, '__qualname__', self.__name__)
+        self.__doc__ = getattr(func, '__doc__', None)
+        self.__dict__.update(getattr(func, '__dict__', ()))  # (e.g. __tag__)
+        self.__wrapped__ = func
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.__wrapped__})"
 
-    @abc.abstractmethod
     def __call__(self, *args, **kwargs):
         return self.__wrapped__(*args, **kwargs)
 
 
-def wrapper(func):
-    """Define the decorated function as a function ``Wrapper``, which
-    decorates other functions, and receives an argument reference to the
-    decorated function upon invocation.
-
-    In place of::
-
-        def assert_result(func):
-            @functools.wraps(func)
-            def wrapped(*args, **kwargs):
-                result = func(*args, **kwargs)
-                assert result
-                return result
-
-            return wrapped
-
-    We might instead::
-
-        @wrapper
-        def assert_result(func, *args, **kwargs):
-            result = func(*args, **kwargs)
-            assert result
-            return result
-
-    Functions decorated by ``wrapper`` are subclasses of ``Wrapper``.
-
-    """
-    def call(self, *args, **kwargs):
-        return func(self.__wrapped__, *args, **kwargs)
-
-    return type(func.__name__, (Wrapper,), {
-        '__call__': call,
-        '__module__': func.__module__,
-    })
-
-
 # contextlib improvements #
 
 class _SharingMixin:
@@ -74,6 +42,7 @@ class _SharingMixin:
         def __init__(self, cm, func):
             super().__init__(func)
             self.cm = cm
+            self._recreate_cm = cm._recreate_cm
 
         def __get__(self, instance, cls=None):
             if instance is not None:
@@ -84,10 +53,19 @@ class _SharingMixin:
         def _call_(self, instance, *args, **kwargs):
             # unlike the builtin, we'll pass the result of __enter__ to the
             # decorated function as an initial argument
-            with self.cm._recreate_cm() as ctx:
-                ctx_args = () if ctx is None else (ctx,)
-                inner_self = () if instance is None else (instance,)
-                return self.__wrapped__(*(inner_self + ctx_args + args), **kwargs)
+            #
+            # (branching rather than concatenating argument tuples)
+            with self._recreate_cm() as ctx:
+                if instance is None:
+                    if ctx is None:
+                        return self.__wrapped__(*args, **kwargs)
+
+                    return self.__wrapped__(ctx, *args, **kwargs)
+
+                if ctx is None:
+                    return self.__wrapped__(instance, *args, **kwargs)
+
+                return self.__wrapped__(instance, ctx, *args, **kwargs)
 
         def __call__(self, *args, **kwargs):
             return self._call_(None, *args, **kwargs)
@@ -209,10 +187,23 @@ class contextmanager(_ComposingMixin, Wrapper):
     def _get_cm(self):
         return self()
 
+    def decorate(self, func):
+        """Decorate the given function with this (argument-less) context
+        manager.
+
+        Equivalent to bare decoration -- ``@some_generator`` -- but
+        without inspection of the arguments.
+
+        """
+        return _SharingGeneratorContextManager(self.__wrapped__, (), {})(func)
+
     def __call__(self, *args, **kwds):
         # unlike the builtin, we'll enable decoration without
         # invocation of the decorator
-        if not kwds and len(args) == 1 and callable(args[0]):
-            return _SharingGeneratorContextManager(self.__wrapped__, (), kwds)(args[0])
+        #
+        # (callable rather than a function check: decoratees are often
+        # themselves Wrappers)
+        if len(args) == 1 and not kwds and callable(args[0]):
+            return self.decorate(args[0])
 
         return _SharingGeneratorContextManager(self.__wrapped__, args, kwds)
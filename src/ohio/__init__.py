@@ -5,10 +5,11 @@ Ohio provides the missing links between Python's built-in I/O
 primitives, to help ensure the efficiency, clarity and elegance of your code.
 
 """
-from .baseio import (IOClosed, StreamTextIOBase)
+from .baseio import (IOClosed, StreamBufferedIOBase, StreamTextIOBase)
 from .iterio import IteratorTextIO
 from .csvio import (
     encode_csv,
+    encode_csv_parallel,
     iter_csv,
     iter_dict_csv,
     CsvWriterTextIO,
@@ -16,14 +17,21 @@ from .csvio import (
     CsvTextIO,
     CsvDictTextIO,
 )
-from .pipeio import PipeTextIO, pipe_text
+from .pipeio import (
+    PipeBufferedIO,
+    PipeTextIO,
+    pipe_bytes,
+    pipe_text,
+)
 
 
 __all__ = (
     'IOClosed',
     'StreamTextIOBase',
+    'StreamBufferedIOBase',
     'IteratorTextIO',
     'encode_csv',
+    'encode_csv_parallel',
     'iter_csv',
     'iter_dict_csv',
     'CsvWriterTextIO',
@@ -32,6 +40,8 @@ __all__ = (
     'CsvDictTextIO',
     'PipeTextIO',
     'pipe_text',
+    'PipeBufferedIO',
+    'pipe_bytes',
 )
 
 
@@ -22,18 +22,27 @@ class IOClosed(ValueError):
         super().__init__(*args)
 
 
-class StreamTextIOBase(io.TextIOBase):
-    """Readable file-like abstract base class.
+class StreamIOBase:
+    """Readable file-like mixin, common to ``StreamTextIOBase`` and
+    ``StreamBufferedIOBase``.
 
     Concrete classes must implement method ``__next_chunk__`` to return
-    chunk(s) of the text to be read.
+    chunk(s) of the data to be read; (and, must specify the ``_empty``
+    value of these chunks).
 
     """
+    _empty = None
+    _newline = None
+
     def __init__(self):
-        self._remainder = ''
+        # the current chunk, and the position up to which it's been read;
+        # (advancing a cursor rather than re-slicing what's left of the
+        # chunk saves copying its unread data upon every read)
+        self._remainder = self._empty
+        self._remainder_pos = 0
 
     def __next_chunk__(self):
-        raise NotImplementedError("StreamTextIOBase subclasses must implement __next_chunk__")
+        raise NotImplementedError("StreamIOBase subclasses must implement __next_chunk__")
 
     def readable(self):
         if self.closed:
@@ -41,15 +50,25 @@ class StreamTextIOBase(io.TextIOBase):
 
         return True
 
+    def _next_remainder(self):
+        try:
+            self._remainder = self.__next_chunk__()
+        except StopIteration:
+            self._remainder = self._empty
+            return False
+        finally:
+            self._remainder_pos = 0
+
+        return True
+
     def _read1(self, size=None):
-        while not self._remainder:
-            try:
-                self._remainder = self.__next_chunk__()
-            except StopIteration:
-                break
+        while self._remainder_pos == len(self._remainder):
+            if not self._next_remainder():
+                return self._empty
 
-        result = self._remainder[:size]
-        self._remainder = self._remainder[len(result):]
+        start = self._remainder_pos
+        result = self._remainder[start:] if size is None else self._remainder[start:(start + size)]
+        self._remainder_pos += len(result)
 
         return result
 
@@ -60,7 +79,8 @@ class StreamTextIOBase(io.TextIOBase):
         if size is not None and size < 0:
             size = None
 
-        result = ''
+        # accumulate parts to join once, (rather than concatenate)
+        parts = []
 
         while size is None or size > 0:
             content = self._read1(size)
@@ -70,28 +90,96 @@ class StreamTextIOBase(io.TextIOBase):
             if size is not None:
                 size -= len(content)
 
-            result += content
+            parts.append(content)
 
-        return result
+        return self._empty.join(parts)
+
+    def read1(self, size=-1):
+        """Read and return up to ``size`` characters (or bytes), (or all
+        remaining if ``size`` is negative or ``None``), of at most one
+        chunk of the stream.
+
+        Unlike ``read``, ``read1`` retrieves no further chunk than is
+        required to return any data at all; and so, it returns empty
+        only upon the end of the stream.
+
+        """
+        if self.closed:
+            raise IOClosed()
+
+        if size is not None and size < 0:
+            size = None
+
+        return self._read1(size)
 
     def readline(self):
         if self.closed:
             raise IOClosed()
 
-        result = ''
+        parts = []
 
         while True:
-            index = self._remainder.find('\n')
+            start = self._remainder_pos
+            index = self._remainder.find(self._newline, start)
             if index == -1:
-                result += self._remainder
-                try:
-                    self._remainder = self.__next_chunk__()
-                except StopIteration:
-                    self._remainder = ''
+                parts.append(self._remainder[start:])
+                if not self._next_remainder():
                     break
             else:
-                result += self._remainder[:(index + 1)]
-                self._remainder = self._remainder[(index + 1):]
+                self._remainder_pos = index + 1
+                parts.append(self._remainder[start:self._remainder_pos])
                 break
 
-        return result
+        return self._empty.join(parts)
+
+
+class StreamTextIOBase(StreamIOBase, io.TextIOBase):
+    """Readable file-like abstract base class.
+
+    Concrete classes must implement method ``__next_chunk__`` to return
+    chunk(s) of the text to be read.
+
+    """
+    _empty = ''
+    _newline = '\n'
+
+
+class StreamBufferedIOBase(StreamIOBase, io.BufferedIOBase):
+    """Readable binary file-like abstract base class.
+
+    Concrete classes must implement method ``__next_chunk__`` to return
+    chunk(s) of the bytes to be read.
+
+    """
+    _empty = b''
+    _newline = b'\n'
+
+    def readinto(self, buffer):
+        """Read bytes into the given pre-allocated, writable bytes-like
+        object, and return the number of bytes read.
+
+        Bytes are copied directly from each chunk into ``buffer``.
+
+        """
+        if self.closed:
+            raise IOClosed()
+
+        written = 0
+
+        with memoryview(buffer) as view, view.cast('B') as target:
+            size = len(target)
+
+            while written < size:
+                if self._remainder_pos == len(self._remainder) and not self._next_remainder():
+                    break
+
+                start = self._remainder_pos
+                count = min(size - written, len(self._remainder) - start)
+
+                with memoryview(self._remainder) as source:
+                    target[written:(written + count)] = source[start:(start + count)]
+
+                self._remainder_pos += count
+                written += count
+
+        return written
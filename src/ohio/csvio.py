@@ -5,9 +5,13 @@ csvio
 Flexibly encode data to CSV format.
 
 """
+import concurrent.futures
 import csv
 import io
 import itertools
+import operator
+import os
+import re
 
 from . import baseio
 
@@ -83,6 +87,51 @@ def encode_csv(rows, *writer_args, writer=csv.writer, write_header=False, **writ
     return out.getvalue()
 
 
+def encode_csv_parallel(rows, *writer_args, writer=csv.writer, write_header=False,
+                        workers=None, min_parallel=50_000, **writer_kwargs):
+    """Encode the specified iterable of ``rows`` into CSV text, in
+    parallel worker processes.
+
+    ``rows`` are divided into as many contiguous slices as ``workers``
+    (by default, the number of CPUs), which are encoded concurrently by
+    ``ohio.encode_csv`` in a ``concurrent.futures.ProcessPoolExecutor``,
+    and joined in order.
+
+    Rows, and their encodings, must be transferred between processes; as
+    such, fewer than ``min_parallel`` rows, (by default ``50,000``), are
+    simply encoded in-process.
+
+    Otherwise, arguments are as for ``ohio.encode_csv``, (though
+    ``writer`` and its arguments must be picklable).
+
+    """
+    rows = list(rows)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 2 or len(rows) < min_parallel:
+        return encode_csv(rows, *writer_args, writer=writer,
+                          write_header=write_header, **writer_kwargs)
+
+    slice_size = -(-len(rows) // workers)
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = [
+            executor.submit(
+                encode_csv,
+                rows[start:start + slice_size],
+                *writer_args,
+                writer=writer,
+                write_header=(write_header and start == 0),
+                **writer_kwargs
+            )
+            for start in range(0, len(rows), slice_size)
+        ]
+
+        return ''.join([future.result() for future in futures])
+
+
 class CsvTextIO(baseio.StreamTextIOBase):
     r"""Readable file-like interface encoding specified data as CSV.
 
@@ -124,17 +173,29 @@ class CsvTextIO(baseio.StreamTextIOBase):
     list. Finally, we attempted to read the entirety still remaining –
     which was nothing.
 
+    Rows are encoded in chunks of ``chunk_size`` rows. By default, this
+    is determined from the encoded length of the first few rows, such
+    that chunks are of roughly 64 KiB.
+
     """
     make_writer = csv.writer
 
-    def __init__(self, rows, *writer_args, write_header=False, chunk_size=10, **writer_kwargs):
+    # chunk_size='auto': encode a first chunk of auto_chunk_probe rows,
+    # and thereafter chunks of as many rows as approximate a length of
+    # auto_chunk_length
+    auto_chunk_length = 2 ** 16
+    auto_chunk_probe = 10
+
+    def __init__(self, rows, *writer_args, write_header=False, chunk_size='auto', **writer_kwargs):
         super().__init__()
         self.rows = iter(rows)
         self.must_writeheader = write_header
-        self.chunk_size = chunk_size
         self.outfile = io.StringIO()
         self.writer = self.make_writer(self.outfile, *writer_args, **writer_kwargs)
 
+        self._chunk_size_auto = chunk_size == 'auto'
+        self.chunk_size = self.auto_chunk_probe if self._chunk_size_auto else chunk_size
+
     def __next_chunk__(self):
         if self.must_writeheader:
             self.writer.writeheader()
@@ -154,9 +215,49 @@ class CsvTextIO(baseio.StreamTextIOBase):
         self.outfile.seek(0)
         self.outfile.truncate()
 
+        if self._chunk_size_auto:
+            # (header, if any, counts as a row of the probe)
+            self.chunk_size = max(1, self.auto_chunk_length * self.chunk_size // len(text))
+            self._chunk_size_auto = False
+
         return text
 
 
+class _DictWriter(csv.DictWriter):
+    """``csv.DictWriter`` which retrieves the fields of rows featuring
+    exactly its ``fieldnames`` in one ``operator.itemgetter`` call.
+
+    Rows with missing or extra keys are left to ``csv.DictWriter``,
+    (for ``restval`` and ``extrasaction``).
+
+    """
+    def __init__(self, f, fieldnames, *args, **kwargs):
+        super().__init__(f, fieldnames, *args, **kwargs)
+
+        fieldnames = list(self.fieldnames)
+        self._fieldset = set(fieldnames)
+
+        if not fieldnames:
+            # (nothing to get; leave any complaint to csv.DictWriter)
+            self._get_fields = None
+        elif len(fieldnames) == 1:
+            (fieldname,) = fieldnames
+            self._get_fields = lambda rowdict: (rowdict[fieldname],)
+        else:
+            self._get_fields = operator.itemgetter(*fieldnames)
+
+    def _dict_to_list(self, rowdict):
+        # (as invoked by both writerow and writerows)
+        #
+        # compare keys rather than merely count them: a row with the
+        # same number of keys may yet lack some field -- and a mapping
+        # such as defaultdict would fill it in rather than raise
+        if self._get_fields is not None and rowdict.keys() == self._fieldset:
+            return self._get_fields(rowdict)
+
+        return super()._dict_to_list(rowdict)
+
+
 class CsvDictTextIO(CsvTextIO):
     """``CsvTextIO`` which accepts row data in the form of ``dict``.
 
@@ -165,7 +266,7 @@ class CsvDictTextIO(CsvTextIO):
     See also: ``ohio.CsvTextIO``.
 
     """
-    make_writer = csv.DictWriter
+    make_writer = _DictWriter
 
 
 class CsvWriterTextIO(baseio.StreamTextIOBase):
@@ -186,6 +287,17 @@ class CsvWriterTextIO(baseio.StreamTextIOBase):
     generates lines of CSV, rather than eagerly encoding the entire CSV
     body.)
 
+    With ``fast_mode``, rows which are lists or tuples of strings, none
+    of which requires quoting, are joined and written directly, rather
+    than through the csv writer, (which checks each field in turn). The
+    resulting CSV is the same; rows of any other kind, and dialects which
+    do not quote minimally, are left to the csv writer.
+
+    Written CSV may instead be held back until a ``flush_threshold``
+    number of characters have accumulated, (or until ``flush`` is
+    invoked), such that reads -- and ``iter_csv`` -- retrieve fewer,
+    larger chunks.
+
     **Note**: If you don't need to control *how* rows are written, but
     do want an iterative and/or readable interface to encoded CSV,
     consider also the more straight-forward ``ohio.CsvTextIO``.
@@ -267,9 +379,12 @@ class CsvWriterTextIO(baseio.StreamTextIOBase):
     make_writer = csv.writer
 
     @classmethod
-    def iter_csv(cls, rows, *writer_args, write_header=False, **writer_kwargs):
+    def iter_csv(cls, rows, *writer_args, write_header=False, batch_size=1, **writer_kwargs):
         """Generate lines of encoded CSV from ``rows`` of data.
 
+        With ``batch_size``, each generated chunk instead encodes that
+        number of rows, (the header, if any, joining the first).
+
         See: ``ohio.CsvWriterTextIO``.
 
         """
@@ -277,17 +392,66 @@ class CsvWriterTextIO(baseio.StreamTextIOBase):
 
         if write_header:
             csv_buffer.writeheader()
-            yield csv_buffer.read()
+
+            if batch_size == 1:
+                text = csv_buffer.read()
+                if text:
+                    yield text
+
+        rows = iter(rows)
 
         for row in rows:
             csv_buffer.writerow(row)
-            yield csv_buffer.read()
 
-    def __init__(self, *writer_args, **writer_kwargs):
+            if batch_size > 1:
+                csv_buffer.writerows(itertools.islice(rows, batch_size - 1))
+
+            text = csv_buffer.read()
+            if text:
+                yield text
+
+        # release any text held back by flush_threshold
+        csv_buffer.flush()
+        text = csv_buffer.read()
+        if text:
+            yield text
+
+    flush_threshold = None
+
+    def __init__(self, *writer_args, flush_threshold=None, fast_mode=False, **writer_kwargs):
         super().__init__()
         self.outfile = io.StringIO()
         self.writer = self.make_writer(self.outfile, *writer_args, **writer_kwargs)
 
+        if flush_threshold is not None:
+            self.flush_threshold = flush_threshold
+
+        self._must_flush = False
+
+        dialect = getattr(self.writer, 'dialect', None) if fast_mode else None
+        if (
+            dialect is not None and
+            dialect.quoting == csv.QUOTE_MINIMAL and
+            not dialect.skipinitialspace
+        ):
+            specials = set(dialect.delimiter + dialect.lineterminator + '\r\n')
+            specials.update(dialect.quotechar or '')
+            specials.update(dialect.escapechar or '')
+            self._fast_search = re.compile('[%s]' % re.escape(''.join(sorted(specials)))).search
+            self._fast_delimiter = dialect.delimiter
+            self._fast_lineterminator = dialect.lineterminator
+        else:
+            self._fast_search = None
+
+            # nothing to add to the writer's own methods: bind these
+            # directly, sparing a Python call per invocation
+            # (unless overridden by a subclass)
+            if type(self).writerow is CsvWriterTextIO.writerow:
+                self.writerow = self.writer.writerow
+
+            if type(self).writerows is CsvWriterTextIO.writerows:
+                self.writerows = self.writer.writerows
+
     # csv.writer interface #
 
     @property
@@ -295,14 +459,64 @@ class CsvWriterTextIO(baseio.StreamTextIOBase):
         return self.writer.dialect
 
     def writerow(self, row):
+        search = self._fast_search
+
+        # (see writerows)
+        if search is not None and type(row) in (list, tuple) and len(row) > 1:
+            try:
+                if not search(''.join(row)):
+                    self.outfile.write(self._fast_delimiter.join(row) + self._fast_lineterminator)
+                    return
+            except TypeError:
+                pass
+
         self.writer.writerow(row)
 
     def writerows(self, rows):
-        self.writer.writerows(rows)
+        search = self._fast_search
+
+        if search is None:
+            self.writer.writerows(rows)
+            return
+
+        write = self.outfile.write
+        join = self._fast_delimiter.join
+        lineterminator = self._fast_lineterminator
+        writerow = self.writer.writerow
+
+        for row in rows:
+            # only sequences of str may be joined; and, (as csv quotes a
+            # lone empty field, to distinguish it from no field), rows of
+            # fewer than two fields are simply left to the writer
+            if type(row) in (list, tuple) and len(row) > 1:
+                try:
+                    if not search(''.join(row)):
+                        write(join(row) + lineterminator)
+                        continue
+                except TypeError:
+                    # not all str
+                    pass
+
+            writerow(row)
+
+    def flush(self):
+        """Make all written CSV available to be read, regardless of
+        ``flush_threshold``.
+
+        """
+        super().flush()
+        self._must_flush = True
 
     # StreamTextIOBase readable interface #
 
     def __next_chunk__(self):
+        if (
+            self.flush_threshold and
+            not self._must_flush and
+            self.outfile.tell() < self.flush_threshold
+        ):
+            raise StopIteration
+
         text = self.outfile.getvalue()
 
         if not text:
@@ -311,6 +525,7 @@ class CsvWriterTextIO(baseio.StreamTextIOBase):
 
         self.outfile.seek(0)
         self.outfile.truncate()
+        self._must_flush = False
 
         return text
 
@@ -324,7 +539,14 @@ class CsvDictWriterTextIO(CsvWriterTextIO):
     See also: ``ohio.CsvWriterTextIO``.
 
     """
-    make_writer = csv.DictWriter
+    make_writer = _DictWriter
+
+    def __init__(self, *writer_args, **writer_kwargs):
+        super().__init__(*writer_args, **writer_kwargs)
+
+        # (see CsvWriterTextIO)
+        if type(self).writeheader is CsvDictWriterTextIO.writeheader:
+            self.writeheader = self.writer.writeheader
 
     def writeheader(self):
         self.writer.writeheader()
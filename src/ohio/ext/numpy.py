@@ -11,24 +11,44 @@ by Ohio, to be memory-efficient.
 environment.
 
 """
-import collections
 import csv
 import functools
+import io
+import itertools
 
 import numpy
 
 import ohio
 
 
+# length of text or bytes to collect in (or write to) pipes at a time
+PIPE_CHUNK_SIZE = 2 ** 16
+
+# savetxt format of values: (rather than savetxt's default of '%.18e')
+# 17 significant digits suffice to round-trip float64
+SAVETXT_FMT = '%.17g'
+
+# savetxt format of integer (and boolean) values: (which might otherwise
+# exceed 17 significant digits)
+SAVETXT_INT_FMT = '%d'
+
+# loadtxt parses in C as of NumPy 1.23 (and in Python before then)
+NUMPY_C_LOADTXT = numpy.lib.NumpyVersion(numpy.__version__) >= '1.23.0'
+
+# signature, flags and header extension length of PostgreSQL binary COPY
+PG_COPY_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + bytes(8)
+PG_COPY_BINARY_TRAILER = b'\xff\xff'
+
+
 # Externals #
 
-def pg_copy_to_table(arr, table_name, connectable, columns=None, fmt=None):
+def pg_copy_to_table(arr, table_name, connectable, columns=None, fmt=None, binary=False):
     """Copy ``array`` to database table via PostgreSQL ``COPY``.
 
-    ``ohio.PipeTextIO`` enables the direct, in-process "piping" of
-    ``array`` CSV into the "standard input" of the PostgreSQL
-    ``COPY`` command, for quick, memory-efficient database persistence,
-    (and without the needless involvement of the local file system).
+    ``NpCsvTextIO`` enables the direct reading of ``array`` CSV into
+    the "standard input" of the PostgreSQL ``COPY`` command, for quick,
+    memory-efficient database persistence, (and without the needless
+    involvement of the local file system).
 
     For example, given a SQLAlchemy ``connectable`` – either a database
     connection ``Engine`` or ``Connection`` – and a NumPy ``array``::
@@ -42,42 +62,39 @@ def pg_copy_to_table(arr, table_name, connectable, columns=None, fmt=None):
 
         >>> pg_copy_to_table(arr, 'data', engine, columns=['value'])
 
-    ``pg_copy_to_table`` utilizes ``numpy.savetxt`` and supports its
-    ``fmt`` parameter.
+    ``pg_copy_to_table`` encodes CSV as would ``numpy.savetxt``, and
+    supports its ``fmt`` parameter, (which here defaults to ``'%d'`` for
+    integer arrays, and otherwise to ``'%.17g'``).
+
+    Alternatively, integer and floating-point arrays may be copied in
+    PostgreSQL's binary format, by specifying ``binary=True``. This
+    forgoes the formatting of values as text; however, the types of
+    the target columns must then correspond exactly to the array's
+    ``dtype`` -- *e.g.* ``double precision`` for ``float64``, and
+    ``bigint`` for ``int64``::
+
+        >>> pg_copy_to_table(arr, 'data', engine, columns=['value'], binary=True)
 
     """
     target = _sql_table_columns(table_name, columns)
-    sql = 'COPY {target} FROM STDIN WITH CSV'.format(target=target)
-
-    savetxt_kwargs = {'fmt': fmt} if fmt is not None else {}
-
-    # NOTE: It would be nice to use CsvTextIO in place of PipeTextIO here,
-    # NOTE: and this might provide a minor speed boost, (as with pg_copy_to).
-    #
-    # NOTE: However, while the "meat" of savetxt isn't much, it would also be
-    # NOTE: nice to avoid reimplementing its formatting (fmt) logic, and its
-    # NOTE: handling of array dimensionality -- (at least for now).
-    #
-    # NOTE: That said, there's probably not much to it, and the fmt logic is
-    # NOTE: arguably far less important when the "txt" being "saved" is only an
-    # NOTE: intermediary between the source (array) and the target (database).
-    # NOTE: The fmt is relatively inconsequential so long as the database
-    # NOTE: schema enforces the proper typing and precision.
-    #
-    # NOTE: Rather, fmt matters most to size of the generated CSV; but, at that
-    # NOTE: level, it's just an optimization parameter. (We'd want to keep
-    # NOTE: floats long by default, to avoid losing precision, but allow user
-    # NOTE: to shorten as they like via custom fmt, for smaller CSV payloads.)
-    with ohio.pipe_text(numpy.savetxt,
-                        arr,
-                        delimiter=',',
-                        **savetxt_kwargs) as pipe, \
-            connectable.begin() as tx:
+
+    if binary:
+        if fmt is not None:
+            raise TypeError("keyword argument 'fmt' not supported by binary copy")
+
+        sql = 'COPY {target} FROM STDIN WITH BINARY'.format(target=target)
+        (arr, row_dtype) = _pg_binary_dtype(arr)
+        infile = ohio.pipe_bytes(_write_pg_binary, arr, row_dtype)
+    else:
+        sql = 'COPY {target} FROM STDIN WITH CSV'.format(target=target)
+        infile = NpCsvTextIO(arr, fmt)
+
+    with infile, connectable.begin() as tx:
         # connectable is either an Engine or a Connection,
         # and as such tx is either a new Connection or the Transaction
         conn = tx if hasattr(tx, 'execute') else connectable
         cursor = conn.connection.cursor()
-        cursor.copy_expert(sql, pipe)
+        cursor.copy_expert(sql, infile)
 
 
 def pg_copy_from_query(query, connectable, dtype):
@@ -85,7 +102,7 @@ def pg_copy_from_query(query, connectable, dtype):
     ``COPY``.
 
     ``ohio.PipeTextIO`` enables the in-process "piping" of the
-    PostgreSQL ``COPY`` command into NumPy's ``fromiter``, for quick,
+    PostgreSQL ``COPY`` command into NumPy's ``loadtxt``, for quick,
     memory-efficient construction of ``array`` from database, (and
     without the needless involvement of the local file system).
 
@@ -111,7 +128,7 @@ def pg_copy_from_table(table_name, connectable, dtype, columns=None):
     """Construct ``array`` from database table via PostgreSQL ``COPY``.
 
     ``ohio.PipeTextIO`` enables the in-process "piping" of the
-    PostgreSQL ``COPY`` command into NumPy's ``fromiter``, for quick,
+    PostgreSQL ``COPY`` command into NumPy's ``loadtxt``, for quick,
     memory-efficient construction of ``array`` from database, (and
     without the needless involvement of the local file system).
 
@@ -145,36 +162,40 @@ class NpCsvReader:
     ``NpCsvReader`` returns data cells one-by-one, rather than in rows.
     (This allows its use to populate NumPy ``array`` via ``fromiter``.)
 
+    When initialized with the ``fast_numeric`` flag, lines are instead
+    simply split on commas, bypassing ``csv.reader``. This is suitable
+    only to CSV which features no quoting -- such as PostgreSQL's
+    ``COPY`` of numeric data.
+
     """
-    def __init__(self, encoded, squash=False):
-        self.reader = csv.reader(encoded)
+    def __init__(self, encoded, squash=False, fast_numeric=False):
+        if fast_numeric:
+            self.reader = (line.rstrip('\r\n').split(',') for line in encoded)
+        else:
+            self.reader = csv.reader(encoded)
+
         self.row_count = 0
         self.row_size = None
-        self.remainder = collections.deque() if squash else None
+        self.squash = squash
 
     @property
     def shape(self):
         return (self.row_count, self.row_size)
 
     def __iter__(self):
-        return self
+        if self.squash:
+            return itertools.chain.from_iterable(self._iter_rows())
 
-    def __next__(self):
-        if self.remainder:
-            return self.remainder.popleft()
+        return self._iter_rows()
 
-        decoded = next(self.reader)
+    def _iter_rows(self):
+        for decoded in self.reader:
+            if self.row_count == 0:
+                self.row_size = len(decoded)
 
-        if self.row_count == 0:
-            self.row_size = len(decoded)
+            self.row_count += 1
 
-        self.row_count += 1
-
-        if self.remainder is None:
-            return decoded
-
-        self.remainder.extend(decoded)
-        return self.__next__()
+            yield decoded
 
 
 def _pg_copy_from(source, connectable, dtype):
@@ -192,21 +213,176 @@ def _pg_copy_from(source, connectable, dtype):
             'COPY {source} TO STDOUT WITH CSV'.format(source=source),
         )
 
-        with ohio.pipe_text(writer) as pipe:
-            reader = NpCsvReader(pipe, squash=True)
+        # numeric fields are never quoted by COPY
+        fast_numeric = numpy.dtype(dtype).kind in 'iuf'
+
+        # (the cursor writes row by row -- collect these into chunks)
+        with ohio.pipe_text(writer, chunk_size=PIPE_CHUNK_SIZE) as pipe:
+            if fast_numeric and NUMPY_C_LOADTXT:
+                return numpy.loadtxt(pipe, delimiter=',', dtype=dtype, ndmin=2)
+
+            reader = NpCsvReader(pipe, squash=True, fast_numeric=fast_numeric)
             arr = numpy.fromiter(reader, dtype=dtype)
 
     arr.shape = reader.shape
     return arr
 
 
+class NpCsvTextIO(ohio.StreamTextIOBase):
+    """Readable file-like interface encoding ``array`` as CSV, as would
+    ``numpy.savetxt``.
+
+    Rows are only encoded as needed, in chunks of ``chunk_rows``, as
+    ``NpCsvTextIO`` is read.
+
+    ``fmt`` defaults to ``'%d'`` for integer (and boolean) arrays, and
+    otherwise to ``'%.17g'``.
+
+    Rows of integer and float64 arrays are formatted from Python values,
+    (sparing ``savetxt``'s formatting of NumPy scalars). Otherwise,
+    chunks are encoded by ``numpy.savetxt``.
+
+    """
+    def __init__(self, arr, fmt=None, chunk_rows=1000):
+        super().__init__()
+
+        self.arr = numpy.asarray(arr)
+
+        if self.arr.ndim not in (1, 2):
+            raise ValueError("expected 1D or 2D array, got {}D array instead"
+                             .format(self.arr.ndim))
+
+        if fmt is None:
+            fmt = SAVETXT_INT_FMT if self.arr.dtype.kind in 'biu' else SAVETXT_FMT
+
+        self.fmt = fmt
+        self.chunk_rows = chunk_rows
+        self.row_format = _row_format(self.arr, fmt)
+        self.position = 0
+
+    def __next_chunk__(self):
+        if self.position >= len(self.arr):
+            raise StopIteration
+
+        chunk = self.arr[self.position:self.position + self.chunk_rows]
+        self.position += self.chunk_rows
+
+        if self.row_format is None:
+            outfile = io.StringIO()
+            numpy.savetxt(outfile, chunk, fmt=self.fmt, delimiter=',')
+            return outfile.getvalue()
+
+        if chunk.ndim == 1:
+            chunk = chunk.reshape(-1, 1)
+
+        row_format = self.row_format
+        return ''.join([row_format % tuple(row) for row in chunk.tolist()])
+
+
+def _row_format(arr, fmt):
+    """Construct the format of a CSV row of the given integer or
+    float64 ``array``, as would ``numpy.savetxt``.
+
+    Returns ``None`` for arrays and formats not so handled.
+
+    """
+    # (values of other floating-point types would be formatted differently
+    # as Python floats, by '%s')
+    if not (
+        (arr.dtype.kind in 'biu' or arr.dtype == numpy.float64) and
+        arr.ndim in (1, 2)
+    ):
+        return None
+
+    row_size = 1 if arr.ndim == 1 else arr.shape[1]
+
+    if isinstance(fmt, (list, tuple)):
+        if len(fmt) != row_size:
+            return None
+
+        return ','.join(fmt) + '\n'
+
+    if isinstance(fmt, str):
+        fmt_count = fmt.count('%')
+
+        if fmt_count == 1:
+            return ','.join([fmt] * row_size) + '\n'
+
+        if fmt_count == row_size:
+            return fmt + '\n'
+
+    return None
+
+
+def _pg_binary_dtype(arr):
+    """Construct the structured ``dtype`` of rows of the given integer
+    or floating-point ``array``, as encoded for PostgreSQL binary
+    ``COPY``.
+
+    Returns the (two-dimensional) array together with this ``dtype``.
+
+    """
+    arr = numpy.asarray(arr)
+
+    if arr.ndim == 1:
+        arr = arr.reshape(-1, 1)
+    elif arr.ndim != 2:
+        raise ValueError("expected 1D or 2D array, got {}D array instead"
+                         .format(arr.ndim))
+
+    if not (
+        (arr.dtype.kind == 'i' and arr.dtype.itemsize in (2, 4, 8)) or
+        (arr.dtype.kind == 'f' and arr.dtype.itemsize in (4, 8))
+    ):
+        raise TypeError("binary copy unsupported for dtype: {}".format(arr.dtype))
+
+    # values are big-endian and each prefixed by its length
+    value_dtype = arr.dtype.newbyteorder('>')
+
+    fields = [('field_count', '>i2')]
+    for index in range(arr.shape[1]):
+        fields.append(('length{}'.format(index), '>i4'))
+        fields.append(('value{}'.format(index), value_dtype))
+
+    return (arr, numpy.dtype(fields))
+
+
+def _write_pg_binary(outfile, arr, row_dtype, chunk_size=PIPE_CHUNK_SIZE):
+    """Write the PostgreSQL binary ``COPY`` encoding of the given
+    ``array`` to ``outfile``, in chunks of roughly ``chunk_size`` bytes.
+
+    """
+    (row_count, row_size) = arr.shape
+    chunk_rows = max(1, chunk_size // row_dtype.itemsize)
+
+    outfile.write(PG_COPY_BINARY_HEADER)
+
+    for start in range(0, row_count, chunk_rows):
+        chunk = arr[start:start + chunk_rows]
+
+        rows = numpy.empty(len(chunk), dtype=row_dtype)
+        rows['field_count'] = row_size
+        for index in range(row_size):
+            rows['length{}'.format(index)] = arr.dtype.itemsize
+            rows['value{}'.format(index)] = chunk[:, index]
+
+        outfile.write(rows.tobytes())
+
+    outfile.write(PG_COPY_BINARY_TRAILER)
+
+
 def _sql_table_columns(table, columns=None):
     """Encode given table and optional columns for use in SQL."""
     sql = str(table)
 
     if columns:
         sql += " ({})".format(
-            ', '.join('"{}"'.format(column) for column in columns),
+            ', '.join(map(_quote_ident, columns)),
         )
 
     return sql
+
+
+def _quote_ident(name):
+    """Quote the given identifier for use in SQL."""
+    return '"{}"'.format(str(name).replace('"', '""'))
@@ -25,12 +25,30 @@ your code, which uses them, is run.
 ``import pandas``. Pandas must be available (installed) in your
 environment.
 
+PyArrow is optional: if it is available, ``pg_copy_to`` may use it to
+encode CSV.
+
 """
+import concurrent.futures
 import functools
+import inspect
+import threading
 
+import numpy
 import ohio
+import ohio.ext.numpy
 import pandas
 
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
+
+
+# length of text to collect from row-wise writers before passing it on
+PIPE_CHUNK_SIZE = 2 ** 16
+
 
 @pandas.api.extensions.register_dataframe_accessor('pg_copy_to')
 class DataFramePgCopyTo:
@@ -59,19 +77,193 @@ class DataFramePgCopyTo:
     ``pg_copy_to`` supports all the same parameters as ``to_sql``,
     (excepting parameter ``method``).
 
+    If PyArrow is installed, the ``DataFrame`` may instead be encoded as
+    CSV by PyArrow, by specifying ``arrow=True``::
+
+        >>> df.pg_copy_to('users', engine, arrow=True)
+
+    This is considerably faster; however, PyArrow's handling of missing
+    values differs: it writes these as NULL, and empty strings as such,
+    (whereas the default encoding writes both alike, as empty fields).
+    ``DataFrame`` which PyArrow cannot so encode -- such as
+    those with columns of nested values, or of pandas extension types
+    such as periods -- are instead copied as by default. (``arrow`` is
+    not supported together with ``chunksize``.)
+
+    Alternatively, numeric ``DataFrame`` may be copied in PostgreSQL's
+    binary format, by specifying ``binary=True``::
+
+        >>> df.pg_copy_to('measurements', engine, binary=True)
+
+    This forgoes the formatting and parsing of values as text; however,
+    the types of the table's columns must then correspond exactly to
+    those which ``to_sql`` would create for the ``DataFrame`` -- *e.g.*
+    ``double precision`` for ``float64``, and ``bigint`` for ``int64``.
+    ``DataFrame`` which cannot be so encoded -- those with columns
+    (or index) which are not integer, floating-point or boolean, or
+    which are missing values -- are instead copied as CSV.
+
+    Large ``DataFrame`` may moreover be copied by ``parallelism``
+    concurrent ``COPY`` commands, each of a contiguous slice of rows and
+    over its own database connection::
+
+        >>> df.pg_copy_to('measurements', engine, parallelism=4)
+
+    The table is first prepared (created) as by ``to_sql``. Each slice
+    is then copied in its own transaction; these are committed only
+    once all slices have been copied, and -- should any fail to copy --
+    are all rolled back. (Their commits, however, are independent: the
+    failure of one of these may leave a partial copy.) The connectable
+    may not be a ``Connection`` with a transaction in progress.
+
+    The number of slices is limited to the number of connections
+    available from the engine's connection pool, (by default: 15).
+
+    Note that this may speed up the operation only where the database
+    server has cores to spare, and where the table's indexes,
+    constraints and triggers are few -- as these serialize concurrent
+    writes.
+
     """
+    _to_sql_signature = inspect.signature(pandas.DataFrame.to_sql)
 
     def __init__(self, data_frame):
         self.data_frame = data_frame
 
     @functools.wraps(pandas.DataFrame.to_sql)
-    def __call__(self, *args, **kwargs):
-        self.data_frame.to_sql(
-            *args,
-            method=to_sql_method_pg_copy_to,
-            **kwargs,
+    def __call__(self, *args, binary=False, arrow=False, parallelism=None, **kwargs):
+        bound_args = self._to_sql_signature.bind(self.data_frame, *args, **kwargs)
+        arguments = bound_args.arguments
+        chunked = arguments.get('chunksize') is not None
+
+        if binary and arrow:
+            raise TypeError("keyword arguments 'binary' and 'arrow' are mutually exclusive")
+
+        if binary:
+            if chunked:
+                raise TypeError("keyword argument 'chunksize' not supported by binary copy")
+
+            method = to_sql_method_pg_copy_binary
+        elif arrow:
+            if chunked:
+                raise TypeError("keyword argument 'chunksize' not supported by arrow copy")
+
+            if pyarrow is None:
+                raise ImportError("arrow copy requires pyarrow")
+
+            method = to_sql_method_pg_copy_arrow
+        else:
+            method = to_sql_method_pg_copy_to
+
+        if parallelism is not None and parallelism > 1:
+            self._copy_parallel(bound_args, method, parallelism)
+        else:
+            self.data_frame.to_sql(
+                *args,
+                method=method,
+                **kwargs,
+            )
+
+    def _copy_parallel(self, bound_args, method, parallelism):
+        arguments = bound_args.arguments
+        connectable = arguments['con']
+        engine = connectable.engine
+
+        if connectable is not engine and connectable.in_transaction():
+            raise TypeError("parallel copy unsupported within transaction")
+
+        pandas_sql = pandas.io.sql.SQLDatabase(connectable, schema=arguments.get('schema'))
+        pandas_sql.prep_table(
+            self.data_frame,
+            arguments['name'],
+            if_exists=arguments.get('if_exists', 'fail'),
+            index=arguments.get('index', True),
+            index_label=arguments.get('index_label'),
+            schema=arguments.get('schema'),
+            dtype=arguments.get('dtype'),
         )
 
+        # slices are written to the prepared table
+        arguments['if_exists'] = 'append'
+
+        # each slice holds a connection until all are copied --
+        # any in excess of the pool's capacity would time out waiting
+        capacity = _pool_capacity(engine)
+        if capacity is not None:
+            if connectable is not engine:
+                # (the given Connection holds one of these)
+                capacity -= 1
+
+            parallelism = max(1, min(parallelism, capacity))
+
+        bounds = numpy.linspace(0, len(self.data_frame), parallelism + 1, dtype=int)
+        slices = [self.data_frame.iloc[start:stop]
+                  for (start, stop) in zip(bounds[:-1], bounds[1:])
+                  if stop > start]
+
+        if not slices:
+            return
+
+        # workers commit only once all have copied their slices
+        barrier = threading.Barrier(len(slices))
+
+        with concurrent.futures.ThreadPoolExecutor(len(slices)) as executor:
+            futures = [
+                executor.submit(_copy_slice, data_slice, engine, barrier, bound_args, method)
+                for data_slice in slices
+            ]
+
+        errors = [future.exception() for future in futures if future.exception()]
+
+        if errors:
+            # raise the failure -- rather than others' resulting aborts
+            errors.sort(key=lambda exc: isinstance(exc, threading.BrokenBarrierError))
+            raise errors[0]
+
+
+def _pool_capacity(engine):
+    """Determine the maximum number of connections which may be checked
+    out of the given engine's connection pool at once.
+
+    Returns ``None`` for pools of unlimited capacity.
+
+    """
+    pool = engine.pool
+
+    try:
+        # (QueuePool)
+        (size, max_overflow) = (pool.size(), pool._max_overflow)
+    except AttributeError:
+        # e.g. NullPool
+        return None
+
+    if max_overflow < 0:
+        return None
+
+    return size + max_overflow
+
+
+def _copy_slice(data_slice, engine, barrier, bound_args, method):
+    """Write the given slice of a ``DataFrame`` to table over a new
+    connection, committing only once all parties to the ``barrier``
+    have written theirs.
+
+    """
+    slice_args = bound_args.signature.bind(data_slice, *bound_args.args[1:], **bound_args.kwargs)
+
+    try:
+        with engine.connect() as conn:
+            slice_args.arguments['con'] = conn
+
+            with conn.begin():
+                data_slice.to_sql(*slice_args.args[1:], method=method, **slice_args.kwargs)
+                barrier.wait()
+    except BaseException:
+        # release (and so roll back) the others -- including upon
+        # failure to connect
+        barrier.abort()
+        raise
+
 
 def to_sql_method_pg_copy_to(table, engine, keys, data_iter):
     """Write pandas data to table via stream through PostgreSQL
@@ -81,21 +273,197 @@ def to_sql_method_pg_copy_to(table, engine, keys, data_iter):
     ``ohio.CsvTextIO`` for performance stability.
 
     """
-    columns = ', '.join('"{}"'.format(key) for key in keys)
+    with ohio.CsvTextIO(data_iter) as csv_buffer:
+        _pg_copy_expert(engine, _pg_copy_sql(table, keys), csv_buffer)
+
+
+def to_sql_method_pg_copy_arrow(table, engine, keys, data_iter):
+    """Write pandas ``DataFrame`` to table via stream through
+    PostgreSQL ``COPY``.
+
+    This implements a pandas ``to_sql`` "method", which -- rather than
+    consume ``data_iter`` -- pipes the CSV encoding of the table's
+    entire ``frame``, by PyArrow. As such, this method is suitable only
+    to ``to_sql`` invocations without ``chunksize``.
+
+    Data which PyArrow cannot convert or encode as CSV -- such as
+    nested values (lists and dicts), and pandas extension types (such
+    as periods and intervals) -- as well as timedeltas, (which
+    ``to_sql`` stores as integers), decimals, (which PyArrow formats to
+    a common scale), and bytes, (which PyArrow writes undecorated) --
+    are instead written via ``to_sql_method_pg_copy_to``.
+
+    """
+    frame = table.frame
+
+    if table.index is not None:
+        # (as labeled by to_sql)
+        frame = frame.rename_axis(table.index).reset_index()
+
+    if any(dtype.kind == 'm' for dtype in frame.dtypes):
+        return to_sql_method_pg_copy_to(table, engine, keys, data_iter)
+
+    try:
+        arrow_table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+    except pyarrow.ArrowException:
+        return to_sql_method_pg_copy_to(table, engine, keys, data_iter)
+
+    if not all(_arrow_csv_supported(field.type) for field in arrow_table.schema):
+        return to_sql_method_pg_copy_to(table, engine, keys, data_iter)
+
+    with ohio.pipe_bytes(_write_arrow_csv, arrow_table) as pipe:
+        _pg_copy_expert(engine, _pg_copy_sql(table, keys), pipe)
+
+
+def to_sql_method_pg_copy_binary(table, engine, keys, data_iter):
+    """Write pandas ``DataFrame`` to table via stream through
+    PostgreSQL binary ``COPY``.
+
+    This implements a pandas ``to_sql`` "method", which -- rather than
+    consume ``data_iter`` -- pipes the binary encoding of the table's
+    entire ``frame``. As such, this method is suitable only to
+    ``to_sql`` invocations without ``chunksize``.
+
+    Data which cannot be so encoded are instead written via
+    ``to_sql_method_pg_copy_to``.
+
+    """
+    frame = table.frame
+
+    if table.index is not None:
+        # (as labeled by to_sql)
+        frame = frame.rename_axis(table.index).reset_index()
+
+    row_dtype = _pg_binary_dtype(frame)
+
+    if row_dtype is None:
+        return to_sql_method_pg_copy_to(table, engine, keys, data_iter)
+
+    columns = [frame.iloc[:, index].to_numpy() for index in range(frame.shape[1])]
+
+    with ohio.pipe_bytes(_write_pg_binary, columns, row_dtype) as pipe:
+        _pg_copy_expert(engine, _pg_copy_sql(table, keys, binary=True), pipe)
+
+
+def _pg_binary_dtype(frame):
+    """Construct the structured ``dtype`` of rows of the given
+    ``DataFrame``, as encoded for PostgreSQL binary ``COPY``.
+
+    Values are encoded as those of the types with which ``to_sql``
+    would create their columns. ``None`` is returned for ``DataFrame``
+    which may not be so encoded.
+
+    """
+    fields = [('field_count', '>i2')]
+
+    for (index, dtype) in enumerate(frame.dtypes):
+        if dtype.kind == 'b':
+            value_dtype = '?'
+        elif dtype.kind in 'iu':
+            # (per to_sql: smallint, integer or bigint)
+            if dtype.name in ('int8', 'uint8', 'int16'):
+                value_dtype = '>i2'
+            elif dtype.name in ('uint16', 'int32'):
+                value_dtype = '>i4'
+            elif dtype.name in ('uint32', 'int64'):
+                value_dtype = '>i8'
+            else:
+                return None
+        elif dtype.kind == 'f' and dtype.itemsize in (4, 8):
+            # nulls (NaN) are variable-length -- and unsupported
+            if numpy.isnan(frame.iloc[:, index].to_numpy()).any():
+                return None
+
+            value_dtype = dtype.newbyteorder('>')
+        else:
+            # (including extension types such as Int64 and boolean)
+            return None
+
+        fields.append(('length{}'.format(index), '>i4'))
+        fields.append(('value{}'.format(index), value_dtype))
+
+    return numpy.dtype(fields)
+
+
+def _write_pg_binary(outfile, columns, row_dtype, chunk_size=PIPE_CHUNK_SIZE):
+    """Write the PostgreSQL binary ``COPY`` encoding of the given
+    column arrays to ``outfile``, in chunks of roughly ``chunk_size``
+    bytes.
+
+    """
+    row_count = len(columns[0]) if columns else 0
+    chunk_rows = max(1, chunk_size // row_dtype.itemsize)
+
+    outfile.write(ohio.ext.numpy.PG_COPY_BINARY_HEADER)
+
+    for start in range(0, row_count, chunk_rows):
+        stop = start + chunk_rows
+
+        rows = numpy.empty(min(chunk_rows, row_count - start), dtype=row_dtype)
+        rows['field_count'] = len(columns)
+        for (index, column) in enumerate(columns):
+            rows['length{}'.format(index)] = row_dtype['value{}'.format(index)].itemsize
+            rows['value{}'.format(index)] = column[start:stop]
+
+        outfile.write(rows.tobytes())
+
+    outfile.write(ohio.ext.numpy.PG_COPY_BINARY_TRAILER)
+
+
+def _arrow_csv_supported(arrow_type):
+    """Determine whether values of the given Arrow type are encoded by
+    PyArrow's CSV writer as they would be written by ``to_sql``.
+
+    """
+    if pyarrow.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+
+    return not (
+        # (unsupported by the CSV writer)
+        isinstance(arrow_type, pyarrow.BaseExtensionType) or
+        pyarrow.types.is_nested(arrow_type) or
+        # (formatted differently)
+        pyarrow.types.is_decimal(arrow_type) or
+        pyarrow.types.is_binary(arrow_type) or
+        pyarrow.types.is_large_binary(arrow_type) or
+        pyarrow.types.is_fixed_size_binary(arrow_type)
+    )
+
+
+def _write_arrow_csv(outfile, arrow_table):
+    pyarrow.csv.write_csv(
+        arrow_table,
+        outfile,
+        pyarrow.csv.WriteOptions(include_header=False),
+    )
+
+
+def _pg_copy_sql(table, keys, binary=False):
+    """Construct the PostgreSQL ``COPY`` statement to write to the
+    given pandas ``SQLTable``.
+
+    """
+    columns = ', '.join(map(ohio.ext.numpy._quote_ident, keys))
     if table.schema:
         table_name = '{}.{}'.format(table.schema, table.name)
     else:
         table_name = table.name
 
-    sql = 'COPY {table_name} ({columns}) FROM STDIN WITH CSV'.format(
+    return 'COPY {table_name} ({columns}) FROM STDIN WITH {format}'.format(
         table_name=table_name,
         columns=columns,
+        format='BINARY' if binary else 'CSV',
     )
 
-    with ohio.CsvTextIO(data_iter) as csv_buffer:
-        with engine.connect() as conn:
-            with conn.connection.cursor() as cursor:
-                cursor.copy_expert(sql, csv_buffer)
+
+def _pg_copy_expert(engine, sql, infile):
+    """Execute the given PostgreSQL ``COPY FROM STDIN`` statement with
+    the given file-like input.
+
+    """
+    with engine.connect() as conn:
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(sql, infile)
 
 
 def data_frame_pg_copy_from(sql, engine,
@@ -125,9 +493,10 @@ def data_frame_pg_copy_from(sql, engine,
     ``read_sql`` and ``read_csv``.
 
     In addition, ``pg_copy_from`` accepts the optimization parameter
-    ``buffer_size``, which controls the maximum number of CSV-encoded
-    results written by the database cursor to hold in memory prior to
-    their being read into the ``DataFrame``. Depending on use-case,
+    ``buffer_size``, which controls the maximum number of chunks of
+    CSV-encoded results written by the database cursor to hold in memory
+    prior to their being read into the ``DataFrame``. (Results are
+    collected into chunks of roughly 64 KiB.) Depending on use-case,
     increasing this value may speed up the operation, at the cost of
     additional memory -- and vice-versa. ``buffer_size`` defaults to
     ``100``.
@@ -147,7 +516,7 @@ def data_frame_pg_copy_from(sql, engine,
         if columns:
             source = "{} ({})".format(
                 table_name,
-                ', '.join('"{}"'.format(column) for column in columns),
+                ', '.join(map(ohio.ext.numpy._quote_ident, columns)),
             )
         else:
             source = table_name
@@ -177,7 +546,10 @@ def data_frame_pg_copy_from(sql, engine,
                     source=source),
             )
 
-            with ohio.pipe_text(writer, buffer_size=buffer_size) as pipe:
+            # (the cursor writes row by row -- collect these into chunks)
+            with ohio.pipe_text(writer,
+                                buffer_size=buffer_size,
+                                chunk_size=PIPE_CHUNK_SIZE) as pipe:
                 return pandas.read_csv(
                     pipe,
                     index_col=index_col,
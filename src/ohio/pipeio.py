@@ -5,7 +5,8 @@ pipeio
 Efficiently connect ``read()`` and ``write()`` interfaces.
 
 ``PipeTextIO`` provides a *readable* and iterable interface to text
-whose producer requires a *writable* interface.
+whose producer requires a *writable* interface; (``PipeBufferedIO``
+does the same for bytes).
 
 In contrast to first writing such text to memory and then consuming it,
 ``PipeTextIO`` only allows write operations as necessary to fill its
@@ -14,13 +15,382 @@ buffer, to fulfill read operations, asynchronously. As such,
 significantly boost speed, with a minimum of boilerplate.
 
 """
+import collections
+import io
+import multiprocessing
+import pickle
 import queue
 import threading
 
 from . import baseio
 
 
-class PipeTextIO(baseio.StreamTextIOBase):
+class _SpscQueue:
+    """Bounded FIFO queue for a single producer and single consumer.
+
+    Unlike ``queue.Queue``, (which is designed for any number of
+    producers and consumers, and tracks unfinished tasks), both ends
+    share one lock and condition, guarding a ``deque``.
+
+    Once closed, blocked and subsequent calls to ``put`` and ``get``
+    raise ``IOClosed``.
+
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = collections.deque()
+        self._changed = threading.Condition(threading.Lock())
+        self._closed = False
+
+    def close(self):
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    def put(self, item):
+        with self._changed:
+            while True:
+                if self._closed:
+                    raise baseio.IOClosed()
+
+                if len(self._items) < self.maxsize:
+                    break
+
+                self._changed.wait()
+
+            self._items.append(item)
+            self._changed.notify()
+
+    def get(self):
+        with self._changed:
+            while not self._items:
+                if self._closed:
+                    raise baseio.IOClosed()
+
+                self._changed.wait()
+
+            item = self._items.popleft()
+            self._changed.notify()
+            return item
+
+
+class _RemoteSinkBase:
+    """Writable file-like mixin, which sends chunks of what is written
+    to it to a ``multiprocessing`` queue.
+
+    """
+    _empty = None
+
+    def __init__(self, buffer_queue, chunk_size):
+        super().__init__()
+        self._buffer_queue = buffer_queue
+        self._chunk_size = chunk_size
+        self._chunk_parts = []
+        self._chunk_len = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunk_parts.append(data)
+        self._chunk_len += len(data)
+
+        if self._chunk_len >= self._chunk_size:
+            self._put_chunk()
+
+        return len(data)
+
+    def _put_chunk(self):
+        if self._chunk_parts:
+            self._buffer_queue.put(self._empty.join(self._chunk_parts))
+            self._chunk_parts.clear()
+            self._chunk_len = 0
+
+
+class _RemoteTextSink(_RemoteSinkBase, io.TextIOBase):
+
+    _empty = ''
+
+
+class _RemoteBufferedSink(_RemoteSinkBase, io.BufferedIOBase):
+
+    _empty = b''
+
+    def write(self, data):
+        if type(data) is not bytes:
+            data = bytes(data)
+
+        return _RemoteSinkBase.write(self, data)
+
+
+def _process_write(buffer_queue, sink_class, chunk_size, writer_func, args, kwargs):
+    """Writer process entry point.
+
+    Chunks of output are sent to the given queue, followed by ``None``;
+    or, upon failure, by the exception raised.
+
+    """
+    sink = sink_class(buffer_queue, chunk_size)
+
+    try:
+        writer_func(sink, *args, **kwargs)
+        sink._put_chunk()
+    except Exception as exc:
+        try:
+            pickle.dumps(exc)
+        except Exception:
+            exc = RuntimeError(repr(exc))
+
+        buffer_queue.put(exc)
+    else:
+        buffer_queue.put(None)
+
+
+class _ProcessQueue:
+    """Reader end of the ``multiprocessing`` queue fed by a writer
+    process.
+
+    Implements the interface of ``_SpscQueue`` used by ``PipeIOBase``.
+
+    """
+    context = multiprocessing.get_context('spawn')
+
+    # interval at which to check that the writer process hasn't died
+    # (without sending either None or an exception)
+    process_check_interval = 1
+
+    def __init__(self, maxsize, none):
+        self.maxsize = maxsize
+        self.none = none
+        self.queue = self.context.Queue(maxsize)
+        self.process = None
+
+    def start(self, *args, daemon):
+        self.process = self.context.Process(
+            daemon=daemon,
+            target=_process_write,
+            args=(self.queue, *args),
+        )
+        self.process.start()
+
+    def get(self):
+        while True:
+            try:
+                item = self.queue.get(timeout=self.process_check_interval)
+            except queue.Empty:
+                if self.process.is_alive():
+                    continue
+
+                # (anything the process sent is now at hand)
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    raise RuntimeError("writer process exited with code %s" %
+                                       self.process.exitcode) from None
+
+            return self.none if item is None else item
+
+    def close(self):
+        if self.process is not None and self.process.is_alive():
+            self.process.terminate()
+
+        self.queue.close()
+        self.queue.cancel_join_thread()
+
+
+class PipeIOBase(baseio.StreamIOBase):
+    """Mixin implementing ``PipeTextIO`` and ``PipeBufferedIO``.
+
+    See: ``ohio.PipeTextIO``.
+
+    """
+    _log_debug = False
+    _none = object()
+
+    buffer_queue_size = 10
+
+    chunk_size = None
+
+    # chunk size of writer processes, unless otherwise specified
+    process_chunk_size = 2 ** 16
+
+    thread_daemon = True
+
+    @classmethod
+    def _print_log(cls, where, message='', *message_args):
+        if cls._log_debug:
+            print('[debug]', '[%s]' % where, message % message_args)
+
+    def __init__(self, writer_func, args=None, kwargs=None, buffer_size=None, chunk_size=None,
+                 use_process=False):
+        super().__init__()
+
+        self.__writer_func__ = writer_func
+        self.__writer_args__ = args
+        self.__writer_kwargs__ = kwargs
+
+        self.buffer_queue_size = buffer_size or self.buffer_queue_size
+
+        self.chunk_size = chunk_size or self.chunk_size
+        self._chunk_parts = []
+        self._chunk_len = 0
+
+        self.use_process = use_process
+
+        if use_process:
+            self.chunk_size = self.chunk_size or self.process_chunk_size
+            self._buffer_queue = _ProcessQueue(self.buffer_queue_size, self._none)
+            self._writer = None
+        else:
+            self._buffer_queue = _SpscQueue(self.buffer_queue_size)
+            self._writer = threading.Thread(
+                daemon=self.thread_daemon,
+                target=self._writer_write,
+            )
+
+        self._writer_started = False
+        self._writer_done = False
+        self._writer_exc = None
+        self._writer_sync = False
+
+    def _ensure_started(self):
+        if not self._writer_started:
+            if self.use_process:
+                self._buffer_queue.start(
+                    self._remote_sink_class,
+                    self.chunk_size,
+                    self.__writer_func__,
+                    self.__writer_args__ or (),
+                    self.__writer_kwargs__ or {},
+                    daemon=self.thread_daemon,
+                )
+                self._writer = self._buffer_queue.process
+            else:
+                self._writer.start()
+
+            self._writer_started = True
+            self._print_log('writer', 'started')
+
+    def __next_chunk__(self):
+        if self._log_debug:
+            self._print_log('read')
+
+        if not self._writer_done:
+            self._ensure_started()
+
+            # the writer always enqueues _none last -- no need to poll
+            # whether it's still alive
+            text = self._buffer_queue.get()
+
+            if isinstance(text, BaseException):
+                # (as sent by a writer process)
+                self._writer_exc = text
+                text = self._none
+
+            self._writer_done = text is self._none
+
+        if self._writer_exc:
+            raise self._writer_exc
+
+        if self._writer_done:
+            raise StopIteration
+
+        if self._log_debug:
+            self._print_log('read', '%r', text)
+
+        return text
+
+    def _writer_write(self):
+        args = self.__writer_args__ or ()
+        kwargs = self.__writer_kwargs__ or {}
+        try:
+            self.__writer_func__(self, *args, **kwargs)
+            self._put_chunk()
+        except baseio.IOClosed:
+            self._print_log('writer', 'killed')
+        except Exception as exc:
+            self._print_log('writer', 'error: %r', exc)
+            self._writer_exc = exc
+        else:
+            self._print_log('writer', 'done')
+        finally:
+            # signal end of stream to the reader
+            try:
+                self._buffer_queue.put(self._none)
+            except baseio.IOClosed:
+                pass
+
+    def close(self):
+        super().close()
+
+        # release writer blocked on queue (and thereby kill thread)
+        self._buffer_queue.close()
+
+    def write(self, text):
+        if self._log_debug:
+            self._print_log('write', '%r', text)
+
+        if self.closed:
+            raise baseio.IOClosed()
+
+        text_len = len(text)
+
+        if self._writer_sync:
+            self._chunk_parts.append(text)
+        elif self.chunk_size:
+            self._chunk_parts.append(text)
+            self._chunk_len += text_len
+
+            if self._chunk_len >= self.chunk_size:
+                self._put_chunk()
+        else:
+            self._buffer_queue.put(text)
+
+        if self._log_debug:
+            self._print_log('write', '%s', text_len)
+
+        return text_len
+
+    def read(self, size=None):
+        if (
+            not self._writer_started and
+            (size is None or size < 0) and
+            not self.closed
+        ):
+            # all output is requested at once -- there's nothing to
+            # stream, and so no need of a writer thread (or process)
+            return self._read_sync()
+
+        return super().read(size)
+
+    def _read_sync(self):
+        self._writer_started = self._writer_done = self._writer_sync = True
+        self._print_log('writer', 'started (synchronous)')
+
+        args = self.__writer_args__ or ()
+        kwargs = self.__writer_kwargs__ or {}
+        try:
+            self.__writer_func__(self, *args, **kwargs)
+            return self._empty.join(self._chunk_parts)
+        finally:
+            self._writer_sync = False
+            self._chunk_parts = []
+
+    def _put_chunk(self):
+        if self._chunk_parts:
+            text = self._empty.join(self._chunk_parts)
+            self._chunk_parts.clear()
+            self._chunk_len = 0
+            self._buffer_queue.put(text)
+
+    def writable(self):
+        if self.closed:
+            raise baseio.IOClosed()
+
+        return True
+
+
+class PipeTextIO(PipeIOBase, baseio.StreamTextIOBase):
     r"""Iteratively stream output written by given function through
     readable file-like interface.
 
@@ -160,6 +530,33 @@ class PipeTextIO(baseio.StreamTextIOBase):
         ...         reader = csv.reader(pipe)
         ...         ...
 
+    Writers which make many small writes, (such as ``csv.writer`` or
+    ``cursor.copy_to``, which write row by row), may instead have their
+    output collected into chunks of at least ``chunk_size`` characters,
+    such that only these are passed to the reader::
+
+        >>> with connection.cursor() as cursor:
+        ...     with pipe_text(cursor.copy_to,
+        ...                    'my_table',
+        ...                    format='csv',
+        ...                    chunk_size=65536) as pipe:
+        ...         reader = csv.reader(pipe)
+        ...         ...
+
+    A writer function which is CPU-bound, (and as such would compete
+    with the reader for the GIL), may instead be run in a separate
+    process, with ``use_process=True``. The writer function, and any
+    arguments, must then be picklable; and, it is passed a stand-in
+    writable file-like object, rather than the ``PipeTextIO``. (Output is
+    sent to the reader in chunks of ``chunk_size``, or 64 KiB.)
+
+    (Should the first read request *all* output -- *i.e.* ``read()`` --
+    there is nothing to stream: the writer is then simply run in the
+    calling thread.)
+
+    For writers of bytes, rather than text, see ``ohio.PipeBufferedIO``
+    and its helper ``pipe_bytes``.
+
     Finally, note that copying *to* the database is likely best
     performed via ``ohio.CsvTextIO``, (though copying *from* requires
     ``PipeTextIO``, as above)::
@@ -169,126 +566,67 @@ class PipeTextIO(baseio.StreamTextIOBase):
         ...     cursor.copy_from(csv_buffer, 'my_table', format='csv')
 
     """
-    _log_debug = False
-    _none = object()
+    _remote_sink_class = _RemoteTextSink
 
-    buffer_queue_size = 10
-    queue_wait_timeout = 0.01
 
-    thread_daemon = True
+class PipeBufferedIO(PipeIOBase, baseio.StreamBufferedIOBase):
+    """``PipeTextIO`` for writers of bytes.
 
-    @classmethod
-    def _print_log(cls, where, message='', *message_args):
-        if cls._log_debug:
-            print('[debug]', '[%s]' % where, message % message_args)
+    Bytes written by the given function are streamed through a readable
+    binary file-like interface, (such that no text encoding or decoding
+    takes place in transit).
 
-    def __init__(self, writer_func, args=None, kwargs=None, buffer_size=None):
-        super().__init__()
+    For example, psycopg2's ``copy_expert`` writes the raw bytes of
+    ``COPY ... TO STDOUT`` to any file-like object which is not an
+    ``io.TextIOBase``; and, ``pandas.read_csv`` reads binary file-like
+    objects, (decoding them in C)::
 
-        self.__writer_func__ = writer_func
-        self.__writer_args__ = args
-        self.__writer_kwargs__ = kwargs
-
-        self.buffer_queue_size = buffer_size or self.buffer_queue_size
-        self._buffer_queue = queue.Queue(self.buffer_queue_size)
-
-        self._writer = threading.Thread(
-            daemon=self.thread_daemon,
-            target=self._writer_write,
-        )
-        self._writer_started = False
-        self._writer_exc = None
-
-    @property
-    def _should_wait(self):
-        return not self._writer_started or self._writer.is_alive()
-
-    def _ensure_started(self):
-        if not self._writer_started:
-            self._writer.start()
-            self._writer_started = True
-            self._print_log('writer', 'started')
-
-    def __next_chunk__(self):
-        self._print_log('read')
-
-        self._ensure_started()
-
-        #
-        # There is a race condition between:
-        #
-        #   * checking ``_should_wait`` -- (whether worker alive and could enqueue more)
-        #   * worker finishing up and "dying"
-        #
-        while True:
-            # handle race condition on checking Thread.is_alive
-            try:
-                text = self._buffer_queue.get(self._should_wait,
-                                              self.queue_wait_timeout)
-            except queue.Empty:
-                if not self._should_wait:
-                    text = self._none
-                    break
-            else:
-                break
-
-        if self._writer_exc:
-            raise self._writer_exc
-
-        if text is self._none:
-            raise StopIteration
-
-        self._buffer_queue.task_done()
-
-        self._print_log('read', '%r', text)
-        return text
-
-    def _writer_write(self):
-        args = self.__writer_args__ or ()
-        kwargs = self.__writer_kwargs__ or {}
-        try:
-            self.__writer_func__(self, *args, **kwargs)
-        except baseio.IOClosed:
-            self._print_log('writer', 'killed')
-        except Exception as exc:
-            self._print_log('writer', 'error: %r', exc)
-            self._writer_exc = exc
-        else:
-            self._print_log('writer', 'done')
+        >>> with connection.cursor() as cursor:
+        ...     writer = lambda pipe: cursor.copy_expert(
+        ...         'copy my_table to stdout with csv header',
+        ...         pipe,
+        ...     )
+        ...
+        ...     with PipeBufferedIO(writer) as pipe:
+        ...         data_frame = pandas.read_csv(pipe)
 
-    def close(self):
-        super().close()
+    See: ``ohio.PipeTextIO``.
 
-        # empty queue / trigger writer (and thereby kill thread)
-        if self._buffer_queue.full():
-            self._buffer_queue.get_nowait()
+    """
+    _remote_sink_class = _RemoteBufferedSink
 
-    def write(self, text):
-        self._print_log('write', '%r', text)
+    def write(self, data):
+        # copy any mutable buffer, (which the writer may reuse)
+        if type(data) is not bytes:
+            data = bytes(data)
 
-        if self.closed:
-            raise baseio.IOClosed()
+        # (called per row by writers such as copy_expert -- skip super())
+        return PipeIOBase.write(self, data)
 
-        self._buffer_queue.put(text)
 
-        text_len = len(text)
-        self._print_log('write', '%s', text_len)
-        return text_len
+def pipe_text(writer_func, *args, buffer_size=None, chunk_size=None, use_process=False, **kwargs):
+    return PipeTextIO(
+        writer_func,
+        args=args,
+        kwargs=kwargs,
+        buffer_size=buffer_size,
+        chunk_size=chunk_size,
+        use_process=use_process,
+    )
 
-    def writable(self):
-        if self.closed:
-            raise baseio.IOClosed()
 
-        return True
+pipe_text.__doc__ = PipeTextIO.__doc__
 
 
-def pipe_text(writer_func, *args, buffer_size=None, **kwargs):
-    return PipeTextIO(
+def pipe_bytes(writer_func, *args, buffer_size=None, chunk_size=None, use_process=False, **kwargs):
+    return PipeBufferedIO(
         writer_func,
         args=args,
         kwargs=kwargs,
         buffer_size=buffer_size,
+        chunk_size=chunk_size,
+        use_process=use_process,
     )
 
 
-pipe_text.__doc__ = PipeTextIO.__doc__
+pipe_bytes.__doc__ = PipeBufferedIO.__doc__
@@ -1,6 +1,8 @@
+import collections
 import csv
 import io
 import itertools
+import math
 
 import pytest
 
@@ -36,6 +38,33 @@ class TestEncodeCsv:
         ) == csv_content
 
 
+class TestEncodeCsvParallel:
+
+    def test_writer(self):
+        csv_content = ''.join(ex_csv_stream())
+        assert ohio.encode_csv_parallel(iter(EXAMPLE_ROWS),
+                                        workers=3,
+                                        min_parallel=0) == csv_content
+
+    def test_dictwriter(self):
+        csv_input = iter(EXAMPLE_ROWS)
+        field_names = next(csv_input)
+        dict_input = [dict(zip(field_names, row)) for row in csv_input]
+
+        assert ohio.encode_csv_parallel(
+            dict_input,
+            fieldnames=field_names,
+            writer=csv.DictWriter,
+            write_header=True,
+            workers=3,
+            min_parallel=0,
+        ) == ''.join(ex_csv_stream())
+
+    def test_min_parallel(self):
+        csv_content = ''.join(ex_csv_stream())
+        assert ohio.encode_csv_parallel(EXAMPLE_ROWS, workers=3) == csv_content
+
+
 class TestCsvWriterTextIO:
 
     @pytest.fixture
@@ -80,6 +109,71 @@ class TestCsvWriterTextIO:
         for (actual_line, expected_line) in zip(csv_lines, ex_csv_stream()):
             assert actual_line == expected_line
 
+    def test_flush_threshold(self):
+        buffer = ohio.CsvWriterTextIO(flush_threshold=90)
+        csv_stream = ex_csv_stream()
+
+        buffer.writerow(EXAMPLE_ROWS[0])
+        assert buffer.read() == ''
+
+        buffer.writerow(EXAMPLE_ROWS[1])
+        assert buffer.read() == ''.join(itertools.islice(csv_stream, 2))
+
+        buffer.writerow(EXAMPLE_ROWS[2])
+        assert buffer.read() == ''
+
+        buffer.flush()
+        assert buffer.read() == next(csv_stream)
+
+    @pytest.mark.parametrize('writer_kwargs', ({}, {'delimiter': '|'}, {'dialect': 'unix'}))
+    def test_fast_mode(self, writer_kwargs):
+        def make_rows():
+            return EXAMPLE_ROWS + (
+                ('with,comma', 'with "quote"', 'with\nnewline'),
+                ('with|pipe', "with 'quote'"),
+                ('',),
+                (),
+                [1, None, 2.5],
+                iter(('from', 'iterator')),
+            )
+
+        rows = make_rows()
+        buffer = ohio.CsvWriterTextIO(fast_mode=True, **writer_kwargs)
+        buffer.writerows(rows[:5])
+        for row in rows[5:]:
+            buffer.writerow(row)
+
+        expected = io.StringIO()
+        csv.writer(expected, **writer_kwargs).writerows(make_rows())
+
+        assert buffer.read() == expected.getvalue()
+
+    def test_subclass_override(self):
+        class UpperCsvWriterTextIO(ohio.CsvWriterTextIO):
+
+            def writerow(self, row):
+                super().writerow([field.upper() for field in row])
+
+            def writerows(self, rows):
+                for row in rows:
+                    self.writerow(row)
+
+        buffer = UpperCsvWriterTextIO()
+        buffer.writerow(['a', 'b'])
+        buffer.writerows([['c', 'd']])
+        assert buffer.read() == 'A,B\r\nC,D\r\n'
+
+    def test_iter_csv_flush_threshold(self):
+        csv_chunks = list(ohio.CsvWriterTextIO.iter_csv(EXAMPLE_ROWS, flush_threshold=90))
+        assert len(csv_chunks) < len(EXAMPLE_ROWS)
+        assert ''.join(csv_chunks) == ''.join(ex_csv_stream())
+
+    def test_iter_csv_batch_size(self):
+        csv_chunks = list(ohio.CsvWriterTextIO.iter_csv(EXAMPLE_ROWS, batch_size=2))
+        assert len(csv_chunks) == math.ceil(len(EXAMPLE_ROWS) / 2)
+        assert csv_chunks[0] == ''.join(itertools.islice(ex_csv_stream(), 2))
+        assert ''.join(csv_chunks) == ''.join(ex_csv_stream())
+
 
 class TestCsvDictWriterTextIO:
 
@@ -101,6 +195,42 @@ class TestCsvDictWriterTextIO:
         buffer.writerow(dict(zip(EXAMPLE_ROWS[0], EXAMPLE_ROWS[2])))
         assert buffer.read() == next(csv_stream)
 
+    def test_writerow_fields(self):
+        buffer = ohio.CsvDictWriterTextIO(fieldnames=('a', 'b'), restval='-')
+
+        buffer.writerows([{'b': 2, 'a': 1}, {'a': 3}])
+        assert buffer.read() == '1,2\r\n3,-\r\n'
+
+        with pytest.raises(ValueError):
+            buffer.writerow({'a': 1, 'c': 3})
+
+        with pytest.raises(ValueError):
+            buffer.writerow({'a': 1, 'b': 2, 'c': 3})
+
+        buffer = ohio.CsvDictWriterTextIO(fieldnames=('a',), extrasaction='ignore')
+        buffer.writerows([{'a': 1}, {'a': 2, 'b': 3}])
+        assert buffer.read() == '1\r\n2\r\n'
+
+        buffer = ohio.CsvDictWriterTextIO(fieldnames=('a', 'b'))
+        with pytest.raises(ValueError):
+            buffer.writerow(collections.defaultdict(int, {'a': 1, 'c': 3}))
+
+        buffer = ohio.CsvDictWriterTextIO(fieldnames=())
+        buffer.writerows([{}, {}])
+        assert buffer.read() == '\r\n\r\n'
+
+    def test_subclass_override(self):
+        class CommentedCsvDictWriterTextIO(ohio.CsvDictWriterTextIO):
+
+            def writeheader(self):
+                self.outfile.write('# header\n')
+                super().writeheader()
+
+        buffer = CommentedCsvDictWriterTextIO(fieldnames=('a', 'b'))
+        buffer.writeheader()
+        buffer.writerow({'a': 1, 'b': 2})
+        assert buffer.read() == '# header\na,b\r\n1,2\r\n'
+
     def test_iter_csv(self):
         fieldnames = EXAMPLE_ROWS[0]
         rows = (dict(zip(fieldnames, row)) for row in EXAMPLE_ROWS[1:])
@@ -112,6 +242,17 @@ class TestCsvDictWriterTextIO:
         for (actual_line, expected_line) in zip(csv_lines, ex_csv_stream()):
             assert actual_line == expected_line
 
+    def test_iter_csv_batch_size(self):
+        fieldnames = EXAMPLE_ROWS[0]
+        rows = [dict(zip(fieldnames, row)) for row in EXAMPLE_ROWS[1:]]
+        csv_chunks = list(ohio.CsvDictWriterTextIO.iter_csv(
+            rows,
+            fieldnames=fieldnames,
+            write_header=True,
+            batch_size=len(rows),
+        ))
+        assert csv_chunks == [''.join(ex_csv_stream())]
+
 
 class TestCsvTextIO:
 
@@ -133,6 +274,24 @@ class TestCsvTextIO:
         for (actual_line, expected_line) in zip(buffer, ex_csv_stream()):
             assert actual_line == expected_line
 
+    def test_chunk_size_auto(self):
+        buffer = ohio.CsvTextIO(EXAMPLE_ROWS * 10)
+        buffer.auto_chunk_length = 1000
+        assert buffer.chunk_size == buffer.auto_chunk_probe
+
+        csv_stream = ex_csv_stream()
+        assert buffer.readline() == next(csv_stream)
+
+        # ~47 characters per row
+        assert buffer.chunk_size == 21
+
+        assert buffer.read() == ''.join(csv_stream) + ''.join(ex_csv_stream()) * 9
+
+    def test_chunk_size(self):
+        buffer = ohio.CsvTextIO(EXAMPLE_ROWS, chunk_size=3)
+        assert buffer.read() == ''.join(ex_csv_stream())
+        assert buffer.chunk_size == 3
+
     def test_read_lines_cm(self, buffer):
         with buffer as buffer1:
             assert buffer1 is buffer
@@ -1,4 +1,5 @@
 import functools
+import io
 
 import numpy as np
 import pytest
@@ -81,6 +82,77 @@ class TestNumpyExtPgCopyTo:
 
         assert persisted == expected
 
+    def test_pg_copy_to_table_binary(self, test_engine, use_conn):
+        arr = np.array([
+            [1.000102487, 5.982, 2.901],
+            [103.929, 0.000102, np.nan],
+            [29.103, 8.12, 2.1000002],
+        ])
+
+        op.pg_copy_to_table(
+            arr,
+            'data',
+            get_connectable(test_engine, use_conn),
+            columns=['value0', 'value1', 'value2'],
+            binary=True,
+        )
+
+        persisted = test_engine.execute('select * from data').fetchall()
+        np.testing.assert_array_equal(
+            np.array(persisted),
+            np.column_stack([np.arange(1, 4), arr]),
+        )
+
+    def test_pg_copy_to_table_binary_1d(self, test_engine, use_conn):
+        arr = np.array([1.000102487, 5.982, 2.901, 103.929])
+
+        op.pg_copy_to_table(
+            arr,
+            'data',
+            get_connectable(test_engine, use_conn),
+            columns=['value0'],
+            binary=True,
+        )
+
+        persisted = test_engine.execute('select id, value0 from data').fetchall()
+        assert persisted == list(enumerate(arr, 1))
+
+    def test_pg_copy_to_table_binary_dtype(self, test_engine, use_conn):
+        with pytest.raises(TypeError):
+            op.pg_copy_to_table(
+                np.array([1, 2, 3], dtype='uint8'),
+                'data',
+                get_connectable(test_engine, use_conn),
+                columns=['value0'],
+                binary=True,
+            )
+
+
+class TestNpCsvTextIO:
+
+    @pytest.mark.parametrize('arr', (
+        np.array([1.000102487, 5.982, 2.901, 103.929]),
+        np.arange(12).reshape(4, 3),
+        np.array([[np.nan, np.inf, -0.0]]),
+        np.array([[1.5, 2.5]], dtype='float32'),
+        np.array([1 + 2j, 3j]),
+        np.empty((0, 3)),
+    ))
+    @pytest.mark.parametrize('fmt', ('%.17g', '%1.3f', '%s'))
+    def test_read(self, arr, fmt):
+        expected = io.StringIO()
+        np.savetxt(expected, arr, fmt=fmt, delimiter=',')
+
+        assert op.NpCsvTextIO(arr, fmt, chunk_rows=2).read() == expected.getvalue()
+
+    @pytest.mark.parametrize('arr, expected', (
+        (np.array([2 ** 60, -1]), '1152921504606846976\n-1\n'),
+        (np.array([[True, False]]), '1,0\n'),
+        (np.array([0.1, 1e300]), '0.10000000000000001\n1.0000000000000001e+300\n'),
+    ))
+    def test_read_default_fmt(self, arr, expected):
+        assert op.NpCsvTextIO(arr).read() == expected
+
 
 @pytest.mark.parametrize('use_conn', (True, False))
 class TestNumpyExtPgCopyFrom:
@@ -4,6 +4,7 @@ from datetime import datetime
 import numpy
 import pandas
 import pytest
+import sqlalchemy
 
 import ohio.ext.pandas  # noqa
 
@@ -21,6 +22,13 @@ class TestPandasExtPgCopyTo:
     def names_df(self):
         return pandas.DataFrame({'name': self.names})
 
+    @pytest.fixture(params=(True, False), ids=('arrow', 'csv'))
+    def arrow(self, request):
+        if request.param and ohio.ext.pandas.pyarrow is None:
+            pytest.skip("pyarrow not installed")
+
+        return request.param
+
     @pytest.mark.parametrize('method', ('pg_copy_to', 'pg_copy_from'))
     def test_dataframe_class_access(self, method):
         "pg_copy_* available on DataFrame constructor"
@@ -37,10 +45,10 @@ class TestPandasExtPgCopyTo:
         assert 'pg_copy_to' in members
         assert 'pg_copy_from' not in members
 
-    def test_pg_copy_to(self, engine, df):
+    def test_pg_copy_to(self, engine, df, arrow):
         assert not self.table_exists('users', engine)
 
-        df.pg_copy_to('users', engine)
+        df.pg_copy_to('users', engine, arrow=arrow)
 
         assert self.table_exists('users', engine)
 
@@ -48,6 +56,156 @@ class TestPandasExtPgCopyTo:
         assert results.keys() == ['index', 'name']
         assert results.fetchall() == list(enumerate(self.names))
 
+    def test_pg_copy_to_quoted_column(self, engine, arrow):
+        df = pandas.DataFrame({'say "name"': self.names})
+
+        df.pg_copy_to('users', engine, index=False, arrow=arrow)
+
+        results = engine.execute("select * from users")
+        assert results.keys() == ['say "name"']
+        assert results.fetchall() == [(name,) for name in self.names]
+
+    def test_pg_copy_to_chunksize(self, engine, df):
+        df.pg_copy_to('users', engine, chunksize=3)
+
+        results = engine.execute("select * from users")
+        assert results.fetchall() == list(enumerate(self.names))
+
+    @pytest.mark.parametrize('nested', (
+        None,
+        [[1, 2], [3]],
+        [{'rank': 1}, {'rank': 2}],
+    ), ids=('flat', 'list', 'dict'))
+    def test_pg_copy_to_types(self, engine, nested, arrow):
+        df = pandas.DataFrame(
+            {
+                'last_login': [datetime(2019, 1, 2, 13, 0, 0), None],
+                'score': [302.1, numpy.nan],
+                'active': [True, False],
+            },
+            index=pandas.Index(['Alice', 'Bob'], name='name'),
+        )
+
+        if nested is not None:
+            # nested values are written as their str()
+            df['extra'] = nested
+
+        df.pg_copy_to('users', engine, arrow=arrow)
+
+        results = engine.execute("select * from users")
+        expected = [
+            ('Alice', datetime(2019, 1, 2, 13, 0, 0), 302.1, True),
+            ('Bob', None, None, False),
+        ]
+
+        if nested is None:
+            assert results.keys() == ['name', 'last_login', 'score', 'active']
+            assert results.fetchall() == expected
+        else:
+            assert results.keys() == ['name', 'last_login', 'score', 'active', 'extra']
+            assert results.fetchall() == [
+                row + (str(value),) for (row, value) in zip(expected, nested)
+            ]
+
+    @pytest.mark.parametrize('values, expected', (
+        (pandas.period_range('2020-01', periods=2, freq='M'), ['2020-01', '2020-02']),
+        (pandas.interval_range(0, 2), ['(0, 1]', '(1, 2]']),
+    ), ids=('period', 'interval'))
+    def test_pg_copy_to_extension_types(self, engine, values, expected, arrow):
+        df = pandas.DataFrame({'value': values})
+
+        df.pg_copy_to('values', engine, arrow=arrow)
+
+        results = engine.execute("select value from values")
+        assert results.fetchall() == [(value,) for value in expected]
+
+    def test_pg_copy_to_timedelta(self, engine, arrow):
+        df = pandas.DataFrame({'wait': pandas.to_timedelta([1, 2], unit='s')})
+
+        df.pg_copy_to('waits', engine, index=False, arrow=arrow)
+
+        results = engine.execute("select * from waits")
+        assert results.fetchall() == [(10 ** 9,), (2 * 10 ** 9,)]
+
+    def test_pg_copy_to_binary(self, engine):
+        df = pandas.DataFrame({
+            'rank': numpy.array([1, 2], dtype='int8'),
+            'visits': numpy.array([10, 20], dtype='int32'),
+            'points': numpy.array([2 ** 40, -1], dtype='int64'),
+            'score': numpy.array([302.5, -0.25], dtype='float32'),
+            'ratio': [0.1, 1e300],
+            'active': [True, False],
+        })
+
+        df.pg_copy_to('scores', engine, binary=True)
+
+        results = engine.execute("select * from scores")
+        assert results.keys() == ['index', 'rank', 'visits', 'points', 'score', 'ratio', 'active']
+        assert results.fetchall() == [
+            (0, 1, 10, 2 ** 40, 302.5, 0.1, True),
+            (1, 2, 20, -1, -0.25, 1e300, False),
+        ]
+
+    @pytest.mark.parametrize('values', ([302.1, numpy.nan], ['a', 'b']))
+    def test_pg_copy_to_binary_fallback(self, engine, values):
+        df = pandas.DataFrame({'value': values})
+
+        df.pg_copy_to('scores', engine, binary=True)
+
+        results = engine.execute("select * from scores")
+        assert results.fetchall() == [
+            (index, None if pandas.isna(value) else value)
+            for (index, value) in enumerate(values)
+        ]
+
+    @pytest.mark.parametrize('kwargs', (
+        {'chunksize': 3, 'binary': True},
+        {'chunksize': 3, 'arrow': True},
+        {'binary': True, 'arrow': True},
+    ))
+    def test_pg_copy_to_unsupported_arguments(self, engine, df, kwargs):
+        with pytest.raises(TypeError):
+            df.pg_copy_to('users', engine, **kwargs)
+
+    @pytest.mark.parametrize('parallelism', (2, 3, 8))
+    def test_pg_copy_to_parallel(self, engine, df, parallelism, arrow):
+        df.pg_copy_to('users', engine, parallelism=parallelism, arrow=arrow)
+
+        results = engine.execute("select * from users order by index")
+        assert results.keys() == ['index', 'name']
+        assert results.fetchall() == list(enumerate(self.names))
+
+    def test_pg_copy_to_parallel_pool(self, engine, df):
+        # parallelism in excess of the pool's capacity is limited to it
+        # (rather than awaiting connections which will not be released)
+        small_engine = sqlalchemy.create_engine(engine.url, pool_size=1, max_overflow=1, pool_timeout=1)
+
+        try:
+            df.pg_copy_to('users', small_engine, parallelism=4)
+        finally:
+            small_engine.dispose()
+
+        results = engine.execute("select * from users order by index")
+        assert results.fetchall() == list(enumerate(self.names))
+
+    def test_pg_copy_to_parallel_error(self, engine, df):
+        engine.execute("create table users (index bigint, name text check (name != 'Denise'))")
+
+        with pytest.raises(Exception) as exc_info:
+            df.pg_copy_to('users', engine, if_exists='append', parallelism=2)
+
+        assert 'check constraint' in str(exc_info.value)
+
+        # no slice was committed
+        results = engine.execute("select * from users")
+        assert results.fetchall() == []
+
+    def test_pg_copy_to_parallel_transaction(self, engine, df):
+        with engine.connect() as conn:
+            with conn.begin():
+                with pytest.raises(TypeError):
+                    df.pg_copy_to('users', conn, parallelism=2)
+
 
 class TestPandasExtPgCopyFrom:
 
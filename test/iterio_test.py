@@ -63,6 +63,23 @@ class TestIteratorTextIO:
         assert buffer.read(None)
         assert buffer.__iterator__.__next__.call_count == 11
 
+    def test_read1(self, buffer):
+        csv_stream = ex_csv_stream()
+        header = next(csv_stream)
+
+        assert buffer.read1(5) == header[:5]
+        assert buffer.read1() == header[5:]
+        assert buffer.__iterator__.__next__.call_count == 1
+
+        assert buffer.read1(1000) == next(csv_stream)
+        assert buffer.__iterator__.__next__.call_count == 2
+
+    def test_read1_closed(self, buffer):
+        buffer.close()
+
+        with pytest.raises(ohio.IOClosed):
+            buffer.read1()
+
     def test_readline(self, buffer):
         for (count, line) in enumerate(ex_csv_stream(), 1):
             assert buffer.readline() == line
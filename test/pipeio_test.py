@@ -1,5 +1,6 @@
 import csv
 import io
+import threading
 import time
 import unittest.mock
 
@@ -11,6 +12,15 @@ import ohio
 from . import ex_csv_stream, EXAMPLE_ROWS
 
 
+def write_csv(outfile):
+    csv.writer(outfile).writerows(EXAMPLE_ROWS)
+
+
+def write_csv_broken(outfile):
+    write_csv(outfile)
+    raise RuntimeError('ah!')
+
+
 class TestPipeTextIO:
 
     race_timeout = 0.2
@@ -58,11 +68,32 @@ class TestPipeTextIO:
     def test_read(self, pipe, stream_writer, trial):
         assert stream_writer.write_count == 0
 
+        # (read with size first: a bare first read() is synchronous)
         all_content = ''.join(ex_csv_stream())
-        assert pipe.read() == all_content
+        assert pipe.read(1) + pipe.read() == all_content
 
         assert stream_writer.write_count == 10
 
+    def test_read_sync(self):
+        writer_threads = []
+
+        def writer(outfile):
+            writer_threads.append(threading.current_thread())
+            write_csv(outfile)
+
+        with ohio.PipeTextIO(writer) as pipe:
+            assert pipe.read() == ''.join(ex_csv_stream())
+            assert pipe.read() == ''
+
+        assert writer_threads == [threading.current_thread()]
+        assert not pipe._writer.is_alive()
+
+    @timeout(race_timeout)
+    def test_read_exhausted(self, pipe):
+        assert pipe.read(1) + pipe.read()
+        assert pipe.read() == ''
+        assert pipe.readline() == ''
+
     def test_read_closed(self, pipe):
         pipe.close()
 
@@ -180,7 +211,8 @@ class TestPipeTextIO:
     def test_writer_exception(self, writer):
         with ohio.PipeTextIO(writer) as pipe:
             with pytest.raises(RuntimeError):
-                pipe.read()
+                # (read with size first: a bare first read() is synchronous)
+                pipe.read(1) + pipe.read()
 
             # wait (with timeout)
             for _count in range(20):
@@ -194,6 +226,18 @@ class TestPipeTextIO:
 
         assert pipe.closed
 
+    @timeout(race_timeout)
+    def test_read_chunked(self, stream_writer):
+        pipe = ohio.PipeTextIO(stream_writer, buffer_size=1, chunk_size=100)
+        csv_stream = ex_csv_stream()
+
+        # first chunk collects the header and first two rows
+        assert pipe.readline() == next(csv_stream)
+        assert stream_writer.write_count >= 3
+
+        assert pipe.read() == ''.join(csv_stream)
+        assert stream_writer.write_count == 10
+
     def test_interface_buffer_size(self, stream_writer):
         pipe = ohio.PipeTextIO(stream_writer, buffer_size=1000)
         assert pipe.buffer_queue_size == 1000
@@ -231,3 +275,112 @@ class TestPipeTextIO:
         assert pipe._buffer_queue.maxsize == 100
 
         writer_mock.assert_called_once_with(pipe, stream_writer, flag='test')
+
+
+class TestPipeBufferedIO:
+
+    race_timeout = 0.2
+
+    @staticmethod
+    def bytes_writer(outfile):
+        wrapper = io.TextIOWrapper(outfile, encoding='utf-8', newline='', write_through=True)
+        csv.writer(wrapper).writerows(EXAMPLE_ROWS)
+        wrapper.detach()
+
+    @pytest.fixture
+    def pipe(self):
+        return ohio.PipeBufferedIO(self.bytes_writer, buffer_size=1)
+
+    @timeout(race_timeout)
+    def test_read(self, pipe):
+        assert pipe.read(1) + pipe.read() == ''.join(ex_csv_stream()).encode()
+
+    @timeout(race_timeout)
+    def test_readline(self, pipe):
+        for line in ex_csv_stream():
+            assert pipe.readline() == line.encode()
+
+        assert pipe.readline() == b''
+
+    @timeout(race_timeout)
+    def test_readinto(self, pipe):
+        expected = ''.join(ex_csv_stream()).encode()
+        buffer = bytearray(100)
+
+        assert pipe.readinto(buffer) == 100
+        assert buffer == expected[:100]
+
+        parts = [bytes(buffer)]
+        while True:
+            count = pipe.readinto(buffer)
+            if not count:
+                break
+
+            parts.append(bytes(buffer[:count]))
+
+        assert b''.join(parts) == expected
+
+    @timeout(race_timeout)
+    def test_write_copies(self):
+        def writer(outfile):
+            buffer = bytearray(b'hi\n')
+            outfile.write(buffer)
+            buffer[:] = b'no\n'
+
+        with ohio.PipeBufferedIO(writer) as pipe:
+            # (a bare first read() would run the writer synchronously)
+            assert pipe.read(1) + pipe.read() == b'hi\n'
+
+    @timeout(race_timeout)
+    def test_helper_pipe_bytes(self):
+        with ohio.pipe_bytes(self.bytes_writer, buffer_size=1, chunk_size=100) as pipe:
+            assert pipe.buffer_queue_size == 1
+            assert pipe.chunk_size == 100
+            assert pipe.read(1) + pipe.read() == ''.join(ex_csv_stream()).encode()
+
+
+class TestPipeProcess:
+
+    process_timeout = 10
+
+    @timeout(process_timeout)
+    def test_read(self):
+        with ohio.PipeTextIO(write_csv, use_process=True) as pipe:
+            assert pipe.chunk_size == pipe.process_chunk_size
+            assert pipe.read(5) + pipe.read() == ''.join(ex_csv_stream())
+
+            pipe._writer.join()
+            assert pipe._writer.exitcode == 0
+
+    @timeout(process_timeout)
+    def test_readline_chunked(self):
+        with ohio.pipe_text(write_csv, chunk_size=100, use_process=True) as pipe:
+            assert list(pipe) == list(ex_csv_stream())
+
+    @timeout(process_timeout)
+    def test_writer_exception(self):
+        with ohio.PipeTextIO(write_csv_broken, use_process=True) as pipe:
+            with pytest.raises(RuntimeError, match='ah!'):
+                # (read with size first: a bare first read() is synchronous)
+                pipe.read(1) + pipe.read()
+
+    @timeout(process_timeout)
+    def test_close(self):
+        pipe = ohio.PipeTextIO(write_csv, buffer_size=1, chunk_size=1, use_process=True)
+        assert pipe.read(5) == 'Trans'
+        assert pipe._writer.is_alive()
+
+        pipe.close()
+        pipe._writer.join()
+
+        with pytest.raises(ohio.IOClosed):
+            pipe.read()
+
+    @timeout(process_timeout)
+    def test_pipe_bytes(self):
+        with ohio.pipe_bytes(TestPipeBufferedIO.bytes_writer, use_process=True) as pipe:
+            # (read with size first: a bare first read() is synchronous)
+            assert pipe.read(1) + pipe.read() == ''.join(ex_csv_stream()).encode()
+
+            pipe._writer.join()
+            assert pipe._writer.exitcode == 0